@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
 import json
 import math
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from urllib.request import urlretrieve
+from typing import Any
 
+import requests
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from highpoint.config import data_root
-from highpoint.data.roads import RoadNetwork
-from highpoint.data.terrain import generate_synthetic_dem, save_grid_to_geotiff
 
 SRTM_BASE = "https://prd-tnm.s3.amazonaws.com/StagedProducts/Elevation/1/TIFF/current"
 GEOFABRIK_BASE = "https://download.geofabrik.de"
+DEFAULT_CONCURRENCY = 16
+CONNECT_TIMEOUT_SECONDS = 10.0
+HEAD_TIMEOUT_SECONDS = 30.0
+READ_TIMEOUT_SECONDS = 60.0
+RANGE_CHUNKS = 4
+RANGE_MIN_BYTES = 8 << 20
+RANGE_RETRIES = 3
+DOWNLOAD_BLOCK_BYTES = 1 << 20
+# Each concurrent download may hold RANGE_CHUNKS connections to the same host; download_many
+# grows the pools when a larger concurrency is requested.
+POOL_CONNECTIONS = DEFAULT_CONCURRENCY * RANGE_CHUNKS
 
 app = typer.Typer(help="Download HighPoint terrain and road datasets.")
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -69,27 +88,299 @@ def ensure_directories(root: Path) -> None:
 
 def tiles_for_bbox(lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> list[str]:
     """Return SRTM tile identifiers for the provided bounding box."""
-    tiles: list[str] = []
-    lat_start = math.floor(lat_min)
-    lat_end = math.ceil(lat_max)
-    lon_start = math.floor(lon_min)
-    lon_end = math.ceil(lon_max)
+    return list(
+        _tile_ids(
+            math.floor(lat_min),
+            math.ceil(lat_max),
+            math.floor(lon_min),
+            math.ceil(lon_max),
+        ),
+    )
+
 
-    for lat in range(lat_start, lat_end):
-        for lon in range(lon_start, lon_end):
-            lat_prefix = "n" if lat >= 0 else "s"
-            lon_prefix = "e" if lon >= 0 else "w"
-            tile = f"{lat_prefix}{abs(lat):02d}{lon_prefix}{abs(lon):03d}"
-            tiles.append(tile)
-    return tiles
+@lru_cache(maxsize=32)
+def _tile_ids(lat_start: int, lat_end: int, lon_start: int, lon_end: int) -> tuple[str, ...]:
+    # Each latitude/longitude label is formatted once and combined, instead of per tile.
+    lat_labels = [f"{'n' if lat >= 0 else 's'}{abs(lat):02d}" for lat in range(lat_start, lat_end)]
+    lon_labels = [f"{'e' if lon >= 0 else 'w'}{abs(lon):03d}" for lon in range(lon_start, lon_end)]
+    return tuple(lat + lon for lat in lat_labels for lon in lon_labels)
 
 
 def tile_url(tile: str) -> str:
     return f"{SRTM_BASE}/{tile}/USGS_1_{tile}.tif"
 
 
-def download(url: str, destination: Path, dry_run: bool) -> None:
-    if destination.is_file() and destination.stat().st_size > 0:
+@dataclass(frozen=True)
+class RemoteMetadata:
+    """Validators advertised by the server for a downloadable file."""
+
+    size: int | None
+    etag: str | None
+    # ``None`` when the server did not advertise range support either way.
+    accepts_ranges: bool | None = False
+    sha256: str | None = None
+
+
+@lru_cache(maxsize=1)
+def http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session.
+
+    Reusing one session keeps TCP and TLS connections alive across tiles, so only the first
+    request to a host pays the handshakes. Transient gateway errors are retried with backoff.
+    """
+    session = requests.Session()
+    _mount_adapter(session, POOL_CONNECTIONS)
+    return session
+
+
+def _mount_adapter(session: requests.Session, pool_size: int) -> None:
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("HEAD", "GET"),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _reserve_connections(concurrency: int) -> None:
+    """
+    Grow the shared session's connection pools to fit ``concurrency`` parallel downloads.
+
+    A pool smaller than the number of live connections discards the extras on release, so
+    later requests would pay fresh handshakes again.
+    """
+    pool_size = concurrency * RANGE_CHUNKS
+    session = http_session()
+    adapter = session.get_adapter("https://")
+    if isinstance(adapter, HTTPAdapter):
+        current = int(adapter.poolmanager.connection_pool_kw.get("maxsize", 0))
+        if current >= pool_size:
+            return
+    _mount_adapter(session, pool_size)
+
+
+def remote_metadata(url: str) -> RemoteMetadata:
+    """Issue a HEAD request for ``url``; unknown validators are reported as ``None``."""
+    try:
+        # S3 only reports stored checksums when asked for them explicitly.
+        response = http_session().head(
+            url,
+            headers={"x-amz-checksum-mode": "ENABLED"},
+            allow_redirects=True,
+            timeout=(CONNECT_TIMEOUT_SECONDS, HEAD_TIMEOUT_SECONDS),
+        )
+        response.raise_for_status()
+    except requests.RequestException:  # pragma: no cover - network errors not in tests
+        return RemoteMetadata(size=None, etag=None)
+    headers = response.headers
+    length = headers.get("Content-Length")
+    size = int(length) if length is not None and length.isdigit() else None
+    return RemoteMetadata(
+        size=size,
+        etag=headers.get("ETag"),
+        accepts_ranges=True if "bytes" in headers.get("Accept-Ranges", "").lower() else None,
+        sha256=_decode_sha256(headers.get("x-amz-checksum-sha256")),
+    )
+
+
+def _decode_sha256(value: str | None) -> str | None:
+    """Convert a base64 ``x-amz-checksum-sha256`` header to a hex digest."""
+    if not value:
+        return None
+    try:
+        raw = base64.b64decode(value, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    # Multipart uploads report a checksum of part checksums, which cannot be compared.
+    return raw.hex() if len(raw) == hashlib.sha256().digest_size and "-" not in value else None
+
+
+def _supports_ranges(url: str, remote: RemoteMetadata) -> bool:
+    """Return whether ``url`` serves byte ranges, probing only when the HEAD did not say."""
+    if remote.accepts_ranges is None:
+        # Servers may honour ranges without advertising them; a two-byte probe settles it.
+        return _probe_range_support(url)
+    return remote.accepts_ranges
+
+
+def _probe_range_support(url: str) -> bool:
+    try:
+        with http_session().get(
+            url,
+            headers={"Range": "bytes=0-1"},
+            stream=True,
+            timeout=(CONNECT_TIMEOUT_SECONDS, HEAD_TIMEOUT_SECONDS),
+        ) as response:
+            return response.status_code == 206
+    except requests.RequestException:  # pragma: no cover - network errors not in tests
+        return False
+
+
+def _retrieve(url: str, destination: Path) -> str:
+    """Stream ``url`` into ``destination`` over the shared session and return its SHA-256."""
+    digest = hashlib.sha256()
+    with http_session().get(
+        url,
+        stream=True,
+        timeout=(CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS),
+    ) as response:
+        response.raise_for_status()
+        with destination.open("wb") as handle:
+            for block in response.iter_content(chunk_size=DOWNLOAD_BLOCK_BYTES):
+                handle.write(block)
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def download_ranged(url: str, destination: Path, size: int, chunks: int = RANGE_CHUNKS) -> None:
+    """
+    Fetch ``url`` into ``destination`` as ``chunks`` byte ranges requested in parallel.
+
+    Each range is written in place at its offset through its own file handle, so no
+    platform-specific positional writes are needed. A dropped connection only re-requests the
+    bytes of that range which have not arrived yet.
+    """
+    if size <= 0:
+        raise ValueError("size must be positive for ranged downloads")
+    span = math.ceil(size / max(1, chunks))
+    ranges = [(start, min(start + span, size) - 1) for start in range(0, size, span)]
+    with destination.open("wb") as handle:
+        handle.truncate(size)
+    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="range") as executor:
+        futures = [
+            executor.submit(_fetch_range, url, destination, start, end) for start, end in ranges
+        ]
+        for future in futures:
+            future.result()
+
+
+def _fetch_range(url: str, destination: Path, start: int, end: int) -> None:
+    offset = start
+    for attempt in range(RANGE_RETRIES):
+        try:
+            with (
+                destination.open("r+b") as handle,
+                http_session().get(
+                    url,
+                    headers={"Range": f"bytes={offset}-{end}"},
+                    stream=True,
+                    timeout=(CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS),
+                ) as response,
+            ):
+                if response.status_code != 206:
+                    raise RuntimeError(f"Server ignored range request for {url}.")
+                handle.seek(offset)
+                for block in response.iter_content(chunk_size=DOWNLOAD_BLOCK_BYTES):
+                    remaining = block[: end - offset + 1]
+                    handle.write(remaining)
+                    offset += len(remaining)
+                    if offset > end:
+                        break
+        except (requests.RequestException, OSError):
+            if attempt == RANGE_RETRIES - 1:
+                raise
+        if offset > end:
+            return
+    raise RuntimeError(f"Bytes {offset}-{end} of {url} could not be retrieved.")
+
+
+class DownloadManifest:
+    """
+    Record the size, ETag, SHA-256, and mtime of files published by previous runs.
+
+    A missing or unreadable manifest behaves like an empty one, so every file is verified
+    against the server again. Updates are thread-safe for use from ``download_many``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries = self._load(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, dict[str, Any]]:
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(loaded, dict):
+            return {}
+        return {key: value for key, value in loaded.items() if isinstance(value, dict)}
+
+    def is_current(self, destination: Path, remote: RemoteMetadata) -> bool:
+        """Return True when ``destination`` matches both its record and the server."""
+        try:
+            stat = destination.stat()
+        except OSError:
+            return False
+        with self._lock:
+            entry = self._entries.get(destination.name)
+        if entry is None:
+            # Files fetched before the manifest existed are adopted when the sizes agree.
+            return remote.size is not None and stat.st_size == remote.size
+        if stat.st_size != entry.get("size") or stat.st_mtime_ns != entry.get("mtime_ns"):
+            return False
+        if remote.size is not None and remote.size != entry.get("size"):
+            return False
+        recorded_sha256 = entry.get("sha256")
+        if remote.sha256 is not None and recorded_sha256 not in (None, remote.sha256):
+            return False
+        return remote.etag is None or remote.etag == entry.get("etag")
+
+    def record(
+        self,
+        destination: Path,
+        remote: RemoteMetadata,
+        sha256: str | None = None,
+    ) -> None:
+        stat = destination.stat()
+        with self._lock:
+            previous = self._entries.get(destination.name, {})
+            self._entries[destination.name] = {
+                "size": stat.st_size,
+                "etag": remote.etag,
+                "mtime_ns": stat.st_mtime_ns,
+                # Skips re-record an unchanged file, so keep the digest computed on download.
+                "sha256": sha256 or remote.sha256 or previous.get("sha256"),
+            }
+
+    def save(self) -> None:
+        """Atomically persist the manifest next to the downloaded data."""
+        with self._lock:
+            payload = json.dumps(self._entries, indent=2, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.part")
+        temporary.write_text(payload, encoding="utf-8")
+        temporary.replace(self.path)
+
+
+def download(
+    url: str,
+    destination: Path,
+    dry_run: bool,
+    manifest: DownloadManifest | None = None,
+) -> None:
+    remote: RemoteMetadata | None = None
+    if manifest is not None and not dry_run:
+        remote = remote_metadata(url)
+        if manifest.is_current(destination, remote):
+            manifest.record(destination, remote)
+            typer.echo(f"Skipping up-to-date {destination}")
+            return
+    elif destination.is_file() and destination.stat().st_size > 0:
         typer.echo(f"Skipping existing {destination}")
         return
 
@@ -100,13 +391,59 @@ def download(url: str, destination: Path, dry_run: bool) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f"{destination.name}.part")
     try:
-        urlretrieve(url, temporary)
+        if (
+            remote is not None
+            and remote.size is not None
+            and remote.size >= RANGE_MIN_BYTES
+            and _supports_ranges(url, remote)
+        ):
+            download_ranged(url, temporary, remote.size)
+            # Ranges arrive out of order, so the assembled file is hashed once at the end.
+            sha256 = _file_sha256(temporary)
+        else:
+            sha256 = _retrieve(url, temporary)
         if not temporary.is_file() or temporary.stat().st_size == 0:
             raise RuntimeError(f"Download from {url} produced an empty file.")
+        size = temporary.stat().st_size
+        if remote is not None and remote.size is not None and size != remote.size:
+            raise RuntimeError(f"Download from {url} does not match the advertised size.")
+        if remote is not None and remote.sha256 is not None and sha256 != remote.sha256:
+            raise RuntimeError(f"Download from {url} does not match the published SHA-256.")
         temporary.replace(destination)
     except Exception as exc:  # pragma: no cover - network errors not in tests
         temporary.unlink(missing_ok=True)
         raise RuntimeError(f"Failed to download {url}") from exc
+    if manifest is not None and remote is not None:
+        manifest.record(destination, remote, sha256)
+
+
+def download_many(
+    jobs: Iterable[tuple[str, Path]],
+    dry_run: bool,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    manifest: DownloadManifest | None = None,
+) -> None:
+    """
+    Download ``(url, destination)`` pairs using a bounded pool of worker threads.
+
+    Tile transfers are dominated by network latency rather than CPU, and socket reads release
+    the GIL, so threads overlap those round trips while sharing the pooled connections.
+    The first failure is re-raised once in-flight transfers finish.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    pending = list(jobs)
+    if not pending:
+        return
+    workers = min(concurrency, len(pending))
+    _reserve_connections(workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download") as executor:
+        futures = [
+            executor.submit(download, url, destination, dry_run=dry_run, manifest=manifest)
+            for url, destination in pending
+        ]
+        for future in futures:
+            future.result()
 
 
 def create_toy_assets(dry_run: bool) -> None:
@@ -120,21 +457,26 @@ def create_toy_assets(dry_run: bool) -> None:
     if dry_run:
         typer.echo("DRY RUN: skipping synthetic asset creation.")
         return
+    # GeoPandas and rasterio dominate import time and are only needed for the toy assets.
+    from highpoint.data.roads import RoadNetwork
+    from highpoint.data.terrain import generate_synthetic_dem, save_grid_to_geotiff
+
     toy_dir.mkdir(parents=True, exist_ok=True)
     dem = generate_synthetic_dem()
     save_grid_to_geotiff(dem, dem_path)
     road_network = RoadNetwork.synthetic()
-    features = []
-    for line in road_network.geometries:
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": line.__geo_interface__,
-                "properties": {"source": "synthetic"},
-            },
-        )
+    # Shapely builds a fresh mapping per __geo_interface__ access, so no copy is needed.
+    features = [
+        {
+            "type": "Feature",
+            "geometry": line.__geo_interface__,
+            "properties": {"source": "synthetic"},
+        }
+        for line in road_network.geometries
+    ]
     geojson = {"type": "FeatureCollection", "features": features}
-    roads_path.write_text(json.dumps(geojson, indent=2), encoding="utf-8")
+    with roads_path.open("w", encoding="utf-8") as handle:
+        json.dump(geojson, handle, indent=2)
 
 
 @app.command()
@@ -147,6 +489,13 @@ def main(
         case_sensitive=False,
     ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Print actions without downloading."),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Maximum number of simultaneous tile downloads.",
+    ),
 ) -> None:
     """
     Download terrain and road datasets for the specified region.
@@ -176,12 +525,15 @@ def main(
     else:  # pragma: no cover - defensive; all real regions configure one of the two
         raise RuntimeError(f"Region '{cfg.name}' is missing terrain coverage configuration.")
     typer.echo(f"Preparing to download {len(tiles)} SRTM tiles.")
-    manifest_lines = []
-    for tile in tiles:
-        url = tile_url(tile)
-        filename = root / "terrain" / "raw" / f"{tile}.tif"
-        download(url, filename, dry_run=dry_run)
-        manifest_lines.append(filename.name)
+    raw_dir = root / "terrain" / "raw"
+    jobs = [(tile_url(tile), raw_dir / f"{tile}.tif") for tile in tiles]
+    manifest = DownloadManifest(root / "terrain" / f"{cfg.name}_manifest.json")
+    try:
+        download_many(jobs, dry_run=dry_run, concurrency=concurrency, manifest=manifest)
+    finally:
+        if not dry_run:
+            manifest.save()
+    manifest_lines = [destination.name for _, destination in jobs]
 
     if cfg.roads_url:
         roads_dest = root / "roads" / "raw" / Path(cfg.roads_url).name
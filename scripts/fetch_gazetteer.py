@@ -6,23 +6,159 @@ import csv
 import io
 import tempfile
 import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.request import urlretrieve
+from typing import TYPE_CHECKING
 
+import requests
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from highpoint.config import data_root
 from highpoint.data.geocode import STATE_ABBREVIATIONS
 
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
 GNIS_URL = (
     "https://prd-tnm.s3.amazonaws.com/StagedProducts/GeographicNames/Topical/"
     "PopulatedPlaces_National_Text.zip"
 )
+HTTP_TIMEOUT_SECONDS = 60.0
+RANGE_BUFFER_BYTES = 4 << 20
+GNIS_COLUMNS = ("feature_id", "feature_name", "state_name", "prim_lat_dec", "prim_long_dec")
+OUTPUT_BUFFER_BYTES = 1 << 20
+OUTPUT_BATCH_ROWS = 8192
+OUTPUT_COLUMNS = ("feature_id", "name", "state", "latitude", "longitude", "elevation_m")
 
 app = typer.Typer(help="Download the USGS GNIS gazetteer and build an offline lookup CSV.")
 
 
+class HTTPRangeFile(io.RawIOBase):
+    """
+    Read-only, seekable view of a remote file backed by HTTP ``Range`` requests.
+
+    ``zipfile`` only needs the central directory at the end of the archive and the bytes of
+    the member being extracted, so wrapping this in a ``BufferedReader`` streams one member
+    without downloading the whole archive to disk first. Ranges are fetched through one
+    ``requests`` session so the connection is kept alive between reads.
+    """
+
+    def __init__(self, session: requests.Session, url: str, size: int) -> None:
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Unsupported whence value {whence}.")
+        if position < 0:
+            raise ValueError("Negative seek position.")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: WriteableBuffer, /) -> int:
+        view = memoryview(buffer).cast("B")
+        if self._position >= self.size or len(view) == 0:
+            return 0
+        end = min(self._position + len(view), self.size) - 1
+        response = self.session.get(
+            self.url,
+            headers={"Range": f"bytes={self._position}-{end}"},
+            timeout=HTTP_TIMEOUT_SECONDS,
+        )
+        if response.status_code != 206:
+            raise OSError(f"Server ignored range request for {self.url}.")
+        data = response.content
+        count = len(data)
+        view[:count] = data
+        self._position += count
+        return count
+
+
+def _ranged_size(session: requests.Session, url: str) -> int | None:
+    """
+    Return the remote size when ``url`` supports byte ranges, otherwise ``None``.
+
+    Servers that reject or fail the HEAD request are treated as range-less, so the caller falls
+    back to spooling the archive with a plain GET.
+    """
+    try:
+        response = session.head(url, timeout=HTTP_TIMEOUT_SECONDS, allow_redirects=True)
+    except requests.RequestException:
+        return None
+    if not response.ok:
+        return None
+    headers = response.headers
+    length = headers.get("Content-Length")
+    if "bytes" not in headers.get("Accept-Ranges", "").lower():
+        return None
+    if length is None or not length.isdigit():
+        return None
+    return int(length)
+
+
+def _http_session() -> requests.Session:
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("HEAD", "GET"),
+    )
+    adapter = HTTPAdapter(max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@contextmanager
+def _open_remote_archive(url: str) -> Iterator[zipfile.ZipFile]:
+    """Open the remote ZIP in place, spooling to a temporary file only without range support."""
+    with _http_session() as session:
+        size = _ranged_size(session, url)
+        if size is not None:
+            remote = io.BufferedReader(
+                HTTPRangeFile(session, url, size),
+                buffer_size=RANGE_BUFFER_BYTES,
+            )
+            with remote, zipfile.ZipFile(remote) as archive:
+                yield archive
+            return
+
+        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+        try:
+            with session.get(url, stream=True, timeout=HTTP_TIMEOUT_SECONDS) as response:
+                response.raise_for_status()
+                with tmp_path.open("wb") as sink:
+                    for chunk in response.iter_content(RANGE_BUFFER_BYTES):
+                        sink.write(chunk)
+            with zipfile.ZipFile(tmp_path) as archive:
+                yield archive
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
 @app.command()
 def main(
     output: Path | None = typer.Option(None, help="Optional custom output path for the CSV."),
@@ -38,8 +174,6 @@ def main(
     destination.parent.mkdir(parents=True, exist_ok=True)
 
     typer.echo(f"Downloading GNIS national file to build gazetteer at {destination} ...")
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp_file:
-        tmp_path = Path(tmp_file.name)
     with tempfile.NamedTemporaryFile(
         mode="w",
         encoding="utf-8",
@@ -52,61 +186,56 @@ def main(
         output_tmp_path = Path(output_file.name)
     rows_written = 0
     try:
-        urlretrieve(GNIS_URL, tmp_path)
-        with zipfile.ZipFile(tmp_path) as archive:
+        with _open_remote_archive(GNIS_URL) as archive:
             try:
                 national = archive.open("Text/PopulatedPlaces_National.txt")
             except KeyError as exc:  # pragma: no cover - corrupted download
                 raise RuntimeError("Populated places file not found in GNIS archive.") from exc
             with (
-                io.TextIOWrapper(national, encoding="utf-8") as source,
+                io.TextIOWrapper(national, encoding="utf-8-sig") as source,
                 output_tmp_path.open(
                     "w",
                     encoding="utf-8",
                     newline="",
+                    buffering=OUTPUT_BUFFER_BYTES,
                 ) as sink,
             ):
-                reader = csv.DictReader(source, delimiter="|")
-                writer = csv.DictWriter(
-                    sink,
-                    fieldnames=(
-                        "feature_id",
-                        "name",
-                        "state",
-                        "latitude",
-                        "longitude",
-                        "elevation_m",
-                    ),
+                reader = csv.reader(source, delimiter="|")
+                header = [column.strip() for column in next(reader, [])]
+                missing = [column for column in GNIS_COLUMNS if column not in header]
+                if missing:
+                    raise RuntimeError(f"GNIS populated places file is missing columns {missing}.")
+                id_idx, name_idx, state_idx, lat_idx, lon_idx = (
+                    header.index(column) for column in GNIS_COLUMNS
                 )
-                writer.writeheader()
+                min_length = max(id_idx, name_idx, state_idx, lat_idx, lon_idx) + 1
+                writer = csv.writer(sink)
+                writer.writerow(OUTPUT_COLUMNS)
+                batch: list[tuple[str, ...]] = []
                 for row in reader:
-                    state_name = row.get("state_name", "").strip().upper()
-                    state = STATE_ABBREVIATIONS.get(state_name, "")
-                    name = row.get("feature_name", "").strip()
-                    lat = row.get("prim_lat_dec", "").strip()
-                    lon = row.get("prim_long_dec", "").strip()
+                    if len(row) < min_length:
+                        continue
+                    state = STATE_ABBREVIATIONS.get(row[state_idx].strip().upper(), "")
+                    name = row[name_idx].strip()
+                    lat = row[lat_idx].strip()
+                    lon = row[lon_idx].strip()
                     if not name or not state or not lat or not lon:
                         continue
-                    writer.writerow(
-                        {
-                            "feature_id": row.get("feature_id", "").strip(),
-                            "name": name,
-                            "state": state,
-                            "latitude": lat,
-                            "longitude": lon,
-                            "elevation_m": "",
-                        },
-                    )
-                    rows_written += 1
+                    batch.append((row[id_idx].strip(), name, state, lat, lon, ""))
+                    if len(batch) >= OUTPUT_BATCH_ROWS:
+                        writer.writerows(batch)
+                        rows_written += len(batch)
+                        batch.clear()
+                writer.writerows(batch)
+                rows_written += len(batch)
         if rows_written == 0:
             raise RuntimeError("GNIS archive contained no usable populated-place records.")
         output_tmp_path.replace(destination)
-    except (HTTPError, URLError) as exc:  # pragma: no cover - network failure
+    except requests.RequestException as exc:  # pragma: no cover - network failure
         raise RuntimeError(
-            f"Failed to download GNIS dataset ({exc.reason}). Try again later.",
+            f"Failed to download GNIS dataset ({exc}). Try again later.",
         ) from exc
     finally:
-        tmp_path.unlink(missing_ok=True)
         output_tmp_path.unlink(missing_ok=True)
     typer.echo(f"Wrote {rows_written} populated places to {destination}")
 
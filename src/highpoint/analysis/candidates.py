@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import math
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from typing import Any, overload
 
 import numpy as np
-from scipy.ndimage import gaussian_filter, maximum_filter
+from numpy.typing import NDArray
+from scipy.ndimage import gaussian_filter, maximum_filter1d, minimum_filter1d
 
 from highpoint.data.terrain import TerrainGrid
 
@@ -22,12 +25,93 @@ class TerrainCandidate:
     col: int
 
 
+@dataclass(frozen=True, eq=False)
+class TerrainCandidateArray:
+    """
+    Column-oriented batch of terrain candidates.
+
+    Large DEMs yield far more candidates than are ever scored, so they are kept as parallel
+    NumPy columns. Indexing or iterating yields ``TerrainCandidate`` records for code that
+    evaluates candidates one at a time.
+    """
+
+    x: NDArray[np.float64]
+    y: NDArray[np.float64]
+    elevation_m: NDArray[np.float64]
+    row: NDArray[np.int64]
+    col: NDArray[np.int64]
+
+    @classmethod
+    def empty(cls) -> TerrainCandidateArray:
+        return cls(
+            x=np.empty(0, dtype=np.float64),
+            y=np.empty(0, dtype=np.float64),
+            elevation_m=np.empty(0, dtype=np.float64),
+            row=np.empty(0, dtype=np.int64),
+            col=np.empty(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_candidates(cls, candidates: Iterable[TerrainCandidate]) -> TerrainCandidateArray:
+        """Pack individual candidates into columns."""
+        records = list(candidates)
+        return cls(
+            x=np.array([item.x for item in records], dtype=np.float64),
+            y=np.array([item.y for item in records], dtype=np.float64),
+            elevation_m=np.array([item.elevation_m for item in records], dtype=np.float64),
+            row=np.array([item.row for item in records], dtype=np.int64),
+            col=np.array([item.col for item in records], dtype=np.int64),
+        )
+
+    def take(self, indices: NDArray[np.intp] | Sequence[int]) -> TerrainCandidateArray:
+        """Return the candidates at ``indices`` as a new batch."""
+        selection = np.asarray(indices, dtype=np.intp)
+        return TerrainCandidateArray(
+            x=self.x[selection],
+            y=self.y[selection],
+            elevation_m=self.elevation_m[selection],
+            row=self.row[selection],
+            col=self.col[selection],
+        )
+
+    def __len__(self) -> int:
+        return int(self.x.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> TerrainCandidate: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TerrainCandidateArray: ...
+
+    def __getitem__(self, index: int | slice) -> TerrainCandidate | TerrainCandidateArray:
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        return TerrainCandidate(
+            x=float(self.x[index]),
+            y=float(self.y[index]),
+            elevation_m=float(self.elevation_m[index]),
+            row=int(self.row[index]),
+            col=int(self.col[index]),
+        )
+
+    def __iter__(self) -> Iterator[TerrainCandidate]:
+        for x, y, elevation, row, col in zip(
+            self.x.tolist(),
+            self.y.tolist(),
+            self.elevation_m.tolist(),
+            self.row.tolist(),
+            self.col.tolist(),
+            strict=True,
+        ):
+            yield TerrainCandidate(x=x, y=y, elevation_m=elevation, row=row, col=col)
+
+
 def identify_candidates(
     grid: TerrainGrid,
     neighborhood: int = 3,
     min_prominence_m: float = 10.0,
     min_slope_deg: float = 2.0,
-) -> list[TerrainCandidate]:
+) -> TerrainCandidateArray:
     """
     Detect local maxima in the DEM as candidate viewpoints.
 
@@ -37,82 +121,132 @@ def identify_candidates(
     if neighborhood < 1:
         raise ValueError("neighborhood must be at least 1")
     if grid.height < 2 or grid.width < 2:
-        return []
+        return TerrainCandidateArray.empty()
 
-    valid = np.isfinite(grid.elevations)
+    elevations = grid.contiguous_elevations
+    valid = np.isfinite(elevations)
     if not valid.any():
-        return []
+        return TerrainCandidateArray.empty()
 
     # Normalized smoothing prevents a single nodata cell from poisoning its neighborhood.
-    weights = gaussian_filter(valid.astype(np.float64), sigma=1.0)
-    values = gaussian_filter(np.where(valid, grid.elevations, 0.0), sigma=1.0)
-    smoothed = np.divide(
-        values,
-        weights,
-        out=np.full_like(values, np.nan, dtype=np.float64),
-        where=weights > 0.0,
+    weights = gaussian_filter(valid.astype(np.float32), sigma=1.0, mode="nearest")
+    values = gaussian_filter(
+        np.where(valid, elevations, np.float32(0.0)),
+        sigma=1.0,
+        mode="nearest",
     )
-    finite_smoothed = np.where(np.isfinite(smoothed), smoothed, -np.inf)
-    local_max = maximum_filter(
-        finite_smoothed,
-        footprint=np.ones((neighborhood, neighborhood)),
+    smoothed = np.divide(values, weights, out=values, where=weights > 0.0)
+    smoothed[weights <= 0.0] = np.nan
+    finite_smoothed = np.where(np.isfinite(smoothed), smoothed, np.float32(-np.inf))
+    local_max = _window_max(finite_smoothed, neighborhood, mode="nearest")
+    keep = np.isclose(finite_smoothed, local_max)
+    keep &= valid
+
+    # Prominence and slope are judged over a (2n+1)-cell window, clipped at the raster edge.
+    window = 2 * neighborhood + 1
+    local_min = _window_min(
+        np.where(valid, elevations, np.float32(np.inf)),
+        window,
+        mode="constant",
+        cval=np.inf,
     )
-    mask = np.isclose(finite_smoothed, local_max) & valid
+    keep &= np.subtract(elevations, local_min, out=local_min) >= min_prominence_m
 
+    # slope >= threshold is tested as |gradient| >= tan(threshold), which is monotonic and
+    # avoids evaluating arctan and degrees over the whole grid.
     resolution_x, resolution_y = grid.resolution
     gradient_y, gradient_x = np.gradient(smoothed, resolution_y, resolution_x)
-    slope = np.degrees(np.arctan(np.hypot(gradient_x, gradient_y)))
-
-    xs, ys = grid.coordinates()
-
-    candidates: list[TerrainCandidate] = []
-    for row, col in zip(*np.where(mask), strict=False):
-        elevation = float(grid.elevations[row, col])
-        neighborhood_slice = grid.elevations[
-            max(row - neighborhood, 0) : row + neighborhood + 1,
-            max(col - neighborhood, 0) : col + neighborhood + 1,
-        ]
-        local_min = float(np.nanmin(neighborhood_slice))
-        prominence = elevation - local_min
-        if prominence < min_prominence_m:
-            continue
-        slope_neighborhood = slope[
-            max(row - neighborhood, 0) : row + neighborhood + 1,
-            max(col - neighborhood, 0) : col + neighborhood + 1,
-        ]
-        if float(np.nanmax(slope_neighborhood)) < min_slope_deg:
-            continue
-        candidates.append(
-            TerrainCandidate(
-                x=float(xs[row, col]),
-                y=float(ys[row, col]),
-                elevation_m=elevation,
-                row=row,
-                col=col,
-            ),
-        )
-    return candidates
+    gradient = np.hypot(gradient_x, gradient_y, out=gradient_x)
+    gradient[~np.isfinite(gradient)] = -np.inf
+    max_gradient = _window_max(gradient, window, mode="constant", cval=-np.inf)
+    # A window without any finite slope cannot be judged, so it does not reject the peak.
+    keep &= (max_gradient >= _slope_to_gradient(min_slope_deg)) | (max_gradient == -np.inf)
+
+    rows, cols = np.nonzero(keep)
+    xs, ys = grid.cell_centers(rows, cols)
+    return TerrainCandidateArray(
+        x=xs,
+        y=ys,
+        elevation_m=elevations[rows, cols].astype(np.float64),
+        row=rows.astype(np.int64),
+        col=cols.astype(np.int64),
+    )
+
+
+def _slope_to_gradient(slope_deg: float) -> float:
+    """Return the gradient magnitude (rise over run) equivalent to ``slope_deg``."""
+    if slope_deg >= 90.0:
+        return math.inf
+    return math.tan(math.radians(slope_deg))
+
+
+def _window_max(
+    values: NDArray[np.floating[Any]],
+    size: int,
+    *,
+    mode: str,
+    cval: float = 0.0,
+) -> NDArray[np.floating[Any]]:
+    """Square-window maximum computed as two 1-D passes (2n instead of n² work per cell)."""
+    along_rows = maximum_filter1d(values, size, axis=0, mode=mode, cval=cval)
+    window: NDArray[np.floating[Any]] = maximum_filter1d(
+        along_rows,
+        size,
+        axis=1,
+        mode=mode,
+        cval=cval,
+    )
+    return window
+
+
+def _window_min(
+    values: NDArray[np.floating[Any]],
+    size: int,
+    *,
+    mode: str,
+    cval: float = 0.0,
+) -> NDArray[np.floating[Any]]:
+    """Square-window minimum computed as two 1-D passes."""
+    along_rows = minimum_filter1d(values, size, axis=0, mode=mode, cval=cval)
+    window: NDArray[np.floating[Any]] = minimum_filter1d(
+        along_rows,
+        size,
+        axis=1,
+        mode=mode,
+        cval=cval,
+    )
+    return window
 
 
 def cluster_candidates(
-    candidates: Sequence[TerrainCandidate],
+    candidates: TerrainCandidateArray | Sequence[TerrainCandidate],
     grid_size_m: float,
-) -> list[TerrainCandidate]:
+) -> TerrainCandidateArray:
     """
     Down-sample candidates by grouping them into square bins of size ``grid_size_m``.
 
     The highest elevation candidate per bin is retained to reduce redundancy.
     """
-    if not candidates:
-        return []
-
-    buckets: dict[tuple[int, int], TerrainCandidate] = {}
-    for candidate in candidates:
-        key = (
-            int(candidate.x // grid_size_m),
-            int(candidate.y // grid_size_m),
-        )
-        existing = buckets.get(key)
-        if existing is None or candidate.elevation_m > existing.elevation_m:
-            buckets[key] = candidate
-    return list(buckets.values())
+    batch = (
+        candidates
+        if isinstance(candidates, TerrainCandidateArray)
+        else TerrainCandidateArray.from_candidates(candidates)
+    )
+    if not len(batch):
+        return TerrainCandidateArray.empty()
+
+    bin_x = np.floor_divide(batch.x, grid_size_m).astype(np.int64)
+    bin_y = np.floor_divide(batch.y, grid_size_m).astype(np.int64)
+    # Sort by bin, then highest elevation, then original position so the first entry of each
+    # bin is its winner and ties keep the earliest candidate.
+    order = np.lexsort((np.arange(len(batch)), -batch.elevation_m, bin_y, bin_x))
+    sorted_x = bin_x[order]
+    sorted_y = bin_y[order]
+    new_bin = np.empty(order.shape[0], dtype=bool)
+    new_bin[0] = True
+    new_bin[1:] = (sorted_x[1:] != sorted_x[:-1]) | (sorted_y[1:] != sorted_y[:-1])
+    starts = np.flatnonzero(new_bin)
+    winners = order[starts]
+    # Emit bins in order of their first candidate to keep the output order stable.
+    first_seen = np.minimum.reduceat(order, starts)
+    return batch.take(winners[np.argsort(first_seen, kind="stable")])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from highpoint.config import AppConfig
@@ -30,8 +31,27 @@ def evaluate_candidate_drivability(
     Returns None when walking exceeds the configured maximum or, if provided, driving time
     exceeds the optional limit.
     """
+    access = road_network.nearest_access_point(candidate_xy, config.roads.walking_speed_kmh)
+    return _drivability_from_access(access, observer_xy, config)
+
+
+def evaluate_candidates_drivability(
+    candidates_xy: Sequence[tuple[float, float]],
+    observer_xy: tuple[float, float],
+    road_network: RoadNetwork,
+    config: AppConfig,
+) -> list[DrivabilityResult | None]:
+    """Batch form of ``evaluate_candidate_drivability`` sharing one road network query."""
+    accesses = road_network.nearest_access_points(candidates_xy, config.roads.walking_speed_kmh)
+    return [_drivability_from_access(access, observer_xy, config) for access in accesses]
+
+
+def _drivability_from_access(
+    access: RoadAccessPoint,
+    observer_xy: tuple[float, float],
+    config: AppConfig,
+) -> DrivabilityResult | None:
     roads_cfg = config.roads
-    access = road_network.nearest_access_point(candidate_xy, roads_cfg.walking_speed_kmh)
 
     if access.walking_minutes > roads_cfg.max_walk_minutes:
         return None
@@ -3,29 +3,61 @@
 from __future__ import annotations
 
 import math
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 import numpy as np
-from scipy.ndimage import map_coordinates
+from numpy.typing import NDArray
+from rasterio.transform import Affine
 
-from highpoint.analysis.candidates import TerrainCandidate
+from highpoint.analysis.candidates import TerrainCandidate, TerrainCandidateArray
 from highpoint.config import AppConfig
 from highpoint.data.terrain import TerrainGrid
-from highpoint.utils import miles_to_meters, unit_vector
+from highpoint.utils import miles_to_meters
 
+# Each segment's (steps, rays) temporaries are sized to stay cache resident; larger segments
+# spill to DRAM and measured several times slower on 10 m DEMs.
+RAY_SEGMENT_SAMPLES = 1 << 12
+RAY_MIN_SEGMENT_STEPS = 16
+# Smaller sweeps finish faster than threads can be dispatched, so they stay on one core.
+RAY_MIN_RAYS_PER_WORKER = 16
+# Candidates are traced in groups of about this many rays; larger groups share little more
+# NumPy dispatch and only stretch each segment's working set.
+VISIBILITY_BATCH_RAYS = 1 << 12
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False)
 class VisibilityMetrics:
-    """Visibility statistics along discrete rays."""
+    """
+    Visibility statistics along discrete rays.
+
+    ``ray_results`` holds the visible distance of each ray, ordered clockwise from north in
+    equal azimuth steps; ``ray_angles_deg`` gives the matching azimuths.
+    """
 
     max_distance_m: float
     mean_distance_m: float
     median_distance_m: float
     actual_fov_deg: float
-    ray_results: dict[float, float]
+    ray_results: NDArray[np.float64]
     rays_with_clearance: int
     total_rays: int
 
+    @property
+    def ray_angles_deg(self) -> NDArray[np.float64]:
+        """Return the azimuth of each ray in ``ray_results``."""
+        count = len(self.ray_results)
+        return np.arange(count, dtype=np.float64) * (360.0 / max(count, 1))
+
+    @property
+    def ray_results_dict(self) -> dict[float, float]:
+        """Return ``ray_results`` keyed by azimuth, using the canonical ``i * 360 / N`` angles."""
+        return dict(zip(self.ray_angles_deg.tolist(), self.ray_results.tolist(), strict=True))
+
     @property
     def has_clear_drop(self) -> bool:
         """Return True when at least one ray clears the obstruction belt."""
@@ -39,157 +71,344 @@ def compute_visibility_metrics(
     config: AppConfig,
 ) -> VisibilityMetrics:
     """Compute visibility statistics for a candidate viewpoint."""
+    return compute_visibility_metrics_batch(grid, [candidate], config)[0]
+
+
+def compute_visibility_metrics_batch(
+    grid: TerrainGrid,
+    candidates: TerrainCandidateArray | Sequence[TerrainCandidate],
+    config: AppConfig,
+) -> list[VisibilityMetrics]:
+    """
+    Compute visibility statistics for many candidate viewpoints, in candidate order.
+
+    The rays of several candidates are stacked and traced together, so each segment's NumPy
+    calls are shared across the group instead of being paid once per candidate.
+    """
+    batch = (
+        candidates
+        if isinstance(candidates, TerrainCandidateArray)
+        else TerrainCandidateArray.from_candidates(candidates)
+    )
     visibility_cfg = config.visibility
     cell_size = min(abs(grid.transform.a), abs(grid.transform.e))
     max_distance = config.terrain.max_visibility_km * 1000.0
     max_steps = int(max_distance / cell_size)
-    viewer_height = candidate.elevation_m + visibility_cfg.observer_eye_height_m
+    viewer_heights = batch.elevation_m + visibility_cfg.observer_eye_height_m
 
     az_step = 360.0 / visibility_cfg.rays_full_circle
-    angles = [i * az_step for i in range(visibility_cfg.rays_full_circle)]
-
-    ray_results: dict[float, float] = {}
-    rays_with_clearance = 0
+    angles = np.arange(visibility_cfg.rays_full_circle, dtype=np.float64) * az_step
 
     min_required_distance = miles_to_meters(visibility_cfg.min_visibility_miles)
 
-    for angle in angles:
-        distance, clearance_met = _trace_ray(
+    offsets = _signed_angular_offset(angles, visibility_cfg.azimuth_deg)
+    in_sector = np.abs(offsets) <= visibility_cfg.azimuth_tolerance_deg + 1e-9
+    sector_rays = np.flatnonzero(in_sector)[np.argsort(offsets[in_sector], kind="stable")]
+    sector_width = min(360.0, visibility_cfg.azimuth_tolerance_deg * 2.0)
+    circular = math.isclose(sector_width, 360.0)
+
+    results: list[VisibilityMetrics] = []
+    group = max(1, VISIBILITY_BATCH_RAYS // len(angles))
+    for first in range(0, len(batch), group):
+        members = slice(first, first + group)
+        distances, clearances = _trace_rays(
             grid=grid,
-            candidate=candidate,
-            viewer_height=viewer_height,
-            angle_deg=angle,
+            candidates=batch[members],
+            viewer_heights=viewer_heights[members],
+            angles_deg=angles,
             cell_size=cell_size,
             max_steps=max_steps,
             obstruction_start=visibility_cfg.obstruction_start_m,
             obstruction_height=visibility_cfg.obstruction_height_m,
         )
-        ray_results[angle] = distance
-        if clearance_met:
-            rays_with_clearance += 1
-
-    sector_rays = sorted(
-        (
-            (_signed_angular_offset(angle, visibility_cfg.azimuth_deg), distance)
-            for angle, distance in ray_results.items()
-            if abs(_signed_angular_offset(angle, visibility_cfg.azimuth_deg))
-            <= visibility_cfg.azimuth_tolerance_deg + 1e-9
+        # Statistics reduce along the ray axis, once per group rather than once per candidate.
+        sector_distances = distances[:, sector_rays]
+        if sector_rays.size:
+            maxima = sector_distances.max(axis=1).tolist()
+            means = np.mean(sector_distances, axis=1).tolist()
+            medians = np.median(sector_distances, axis=1).tolist()
+        else:
+            maxima = means = medians = [0.0] * len(distances)
+        clear_runs = _longest_clear_runs(
+            sector_distances >= min_required_distance,
+            circular=circular,
+        )
+        cleared = np.count_nonzero(clearances, axis=1)
+        for index, ray_distances in enumerate(distances):
+            results.append(
+                VisibilityMetrics(
+                    max_distance_m=maxima[index],
+                    mean_distance_m=means[index],
+                    median_distance_m=medians[index],
+                    actual_fov_deg=min(sector_width, int(clear_runs[index]) * az_step),
+                    ray_results=ray_distances,
+                    rays_with_clearance=int(cleared[index]),
+                    total_rays=len(angles),
+                ),
+            )
+    return results
+
+
+def _trace_rays(
+    grid: TerrainGrid,
+    candidates: TerrainCandidateArray,
+    viewer_heights: NDArray[np.float64],
+    angles_deg: NDArray[np.float64],
+    cell_size: float,
+    max_steps: int,
+    obstruction_start: float,
+    obstruction_height: float,
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """
+    Return the visible distance and whether clearance was achieved for each ray.
+
+    Both arrays have one row per candidate and one column per entry of ``angles_deg``.
+    """
+
+    eye_heights = viewer_heights - candidates.elevation_m
+    drop_required = np.maximum(0.0, obstruction_height - eye_heights)
+    shape = (len(candidates), len(angles_deg))
+    distances = np.zeros(shape, dtype=np.float64)
+    clearances = np.repeat((drop_required == 0.0)[:, np.newaxis], len(angles_deg), axis=1)
+    # Rays stop at the raster edge, so steps beyond the farthest pixel center are never
+    # sampled. Long rays over small grids would otherwise spend most of their work off-raster.
+    max_steps = min(max_steps, _steps_to_farthest_cell(grid, candidates, cell_size))
+    if max_steps < 1:
+        return distances, clearances
+
+    # Azimuths are clockwise from north, so east is the sine and north the cosine component.
+    radians = np.radians(angles_deg)
+    rays = _RayFan(
+        origin_x=np.repeat(candidates.x, len(angles_deg)),
+        origin_y=np.repeat(candidates.y, len(angles_deg)),
+        unit_east=np.tile(np.sin(radians), len(candidates)),
+        unit_north=np.tile(np.cos(radians), len(candidates)),
+        ground=np.repeat(candidates.elevation_m, len(angles_deg)),
+        viewer_height=np.repeat(viewer_heights, len(angles_deg)),
+        drop_required=np.repeat(drop_required, len(angles_deg)),
+        # Nothing on the raster stands above its highest cell, which bounds the slope of every
+        # sample a ray has yet to reach.
+        ceiling=np.repeat(
+            grid.max_elevation + obstruction_height - viewer_heights,
+            len(angles_deg),
         ),
-        key=lambda item: item[0],
     )
-    distances_for_sector = [distance for _, distance in sector_rays]
-    clear_rays = [distance >= min_required_distance for distance in distances_for_sector]
-    sector_width = min(360.0, visibility_cfg.azimuth_tolerance_deg * 2.0)
-
-    max_distance_m = max(distances_for_sector, default=0.0)
-    mean_distance_m = float(np.mean(distances_for_sector)) if distances_for_sector else 0.0
-    median_distance_m = float(np.median(distances_for_sector)) if distances_for_sector else 0.0
-    actual_fov_deg = min(
-        sector_width,
-        _longest_clear_run(
-            clear_rays,
-            circular=math.isclose(sector_width, 360.0),
+    inverse = ~grid.transform
+    # Independent blocks of rays can run on separate cores.
+    workers = max(1, min(_ray_workers(), len(rays) // RAY_MIN_RAYS_PER_WORKER))
+    block = math.ceil(len(rays) / workers)
+    starts = range(0, len(rays), block)
+
+    def trace(start: int) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        return _trace_ray_block(
+            grid=grid,
+            rays=rays.take(slice(start, start + block)),
+            inverse=inverse,
+            cell_size=cell_size,
+            max_steps=max_steps,
+            obstruction_start=obstruction_start,
+            obstruction_height=obstruction_height,
         )
-        * az_step,
-    )
 
-    return VisibilityMetrics(
-        max_distance_m=max_distance_m,
-        mean_distance_m=mean_distance_m,
-        median_distance_m=median_distance_m,
-        actual_fov_deg=actual_fov_deg,
-        ray_results=ray_results,
-        rays_with_clearance=rays_with_clearance,
-        total_rays=len(angles),
-    )
+    traced = _ray_executor().map(trace, starts) if workers > 1 else map(trace, starts)
+    flat_distances = distances.reshape(-1)
+    flat_clearances = clearances.reshape(-1)
+    for start, (block_distances, block_clearances) in zip(starts, traced, strict=True):
+        flat_distances[start : start + block] = block_distances
+        flat_clearances[start : start + block] = block_clearances
+    return distances, clearances
+
+
+def _ray_workers() -> int:
+    return os.cpu_count() or 1
 
 
-def _trace_ray(
+@lru_cache(maxsize=1)
+def _ray_executor() -> ThreadPoolExecutor:
+    """
+    Return the shared pool used to trace ray blocks concurrently.
+
+    NumPy releases the GIL inside its array kernels, which make up most of a block's work, so
+    threads overlap without pickling the DEM to other processes.
+    """
+    return ThreadPoolExecutor(max_workers=_ray_workers(), thread_name_prefix="visibility")
+
+
+def _steps_to_farthest_cell(
     grid: TerrainGrid,
-    candidate: TerrainCandidate,
-    viewer_height: float,
-    angle_deg: float,
+    candidates: TerrainCandidateArray,
+    cell_size: float,
+) -> int:
+    """Return a step count past which every ray has left the raster's pixel centers."""
+    corner_cols = np.array([0.5, grid.width - 0.5, 0.5, grid.width - 0.5])
+    corner_rows = np.array([0.5, 0.5, grid.height - 0.5, grid.height - 0.5])
+    xs, ys = grid.transform * (corner_cols, corner_rows)
+    offsets_x = xs[:, np.newaxis] - candidates.x
+    offsets_y = ys[:, np.newaxis] - candidates.y
+    farthest = float(np.max(np.hypot(offsets_x, offsets_y), initial=0.0))
+    # One extra step absorbs rounding in the affine round trip.
+    return int(farthest // cell_size) + 1
+
+
+@dataclass(frozen=True, eq=False)
+class _RayFan:
+    """Origin, direction and per-viewpoint thresholds of each ray traced in one batch."""
+
+    origin_x: NDArray[np.float64]
+    origin_y: NDArray[np.float64]
+    unit_east: NDArray[np.float64]
+    unit_north: NDArray[np.float64]
+    ground: NDArray[np.float64]
+    viewer_height: NDArray[np.float64]
+    drop_required: NDArray[np.float64]
+    ceiling: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return int(self.origin_x.shape[0])
+
+    def take(self, selection: slice | NDArray[np.intp]) -> _RayFan:
+        return _RayFan(
+            origin_x=self.origin_x[selection],
+            origin_y=self.origin_y[selection],
+            unit_east=self.unit_east[selection],
+            unit_north=self.unit_north[selection],
+            ground=self.ground[selection],
+            viewer_height=self.viewer_height[selection],
+            drop_required=self.drop_required[selection],
+            ceiling=self.ceiling[selection],
+        )
+
+
+def _trace_ray_block(
+    grid: TerrainGrid,
+    rays: _RayFan,
+    inverse: Affine,
     cell_size: float,
     max_steps: int,
     obstruction_start: float,
     obstruction_height: float,
-) -> tuple[float, bool]:
-    """Return the visible distance and whether clearance was achieved for one ray."""
-
-    unit_dx, unit_dy = unit_vector(angle_deg)
-    inv_transform = ~grid.transform
-
-    visible_distance = 0.0
-    max_slope = -math.inf
-
-    eye_height = viewer_height - candidate.elevation_m
-    drop_required = max(0.0, obstruction_height - eye_height)
-    clearance_met = drop_required == 0.0
-
-    for step in range(1, max_steps + 1):
-        distance = step * cell_size
-        x = candidate.x + unit_dx * distance
-        y = candidate.y + unit_dy * distance
-        col, row = inv_transform * (x, y)
-        # Affine inversion returns pixel-corner coordinates, while scipy interpolation
-        # treats integer indices as pixel centers.
-        row_index = row - 0.5
-        col_index = col - 0.5
-        if (
-            row_index < 0
-            or row_index > grid.height - 1
-            or col_index < 0
-            or col_index > grid.width - 1
-        ):
-            break
-
-        sample = float(
-            map_coordinates(
-                grid.elevations,
-                [[row_index], [col_index]],
-                order=1,
-                mode="nearest",
-            )[0],
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """
+    Trace a block of rays together, walking outwards one segment of steps at a time.
+
+    After each segment, rays that left the raster, hit the obstruction belt without the
+    required drop, or can no longer find a steeper sample (their ``ceiling`` over the remaining
+    distance) are retired, so only rays with an open horizon keep sampling.
+    """
+
+    # North-up rasters have no rotation terms, so each pixel axis depends on one world axis.
+    north_up = inverse.b == 0.0 and inverse.d == 0.0
+    running_max = np.full(len(rays), -np.inf)
+    visible = np.zeros(len(rays), dtype=np.float64)
+    clearances = rays.drop_required == 0.0
+    blocked = np.zeros(len(rays), dtype=bool)
+    active = np.arange(len(rays))
+    live = rays
+    last_distance = max_steps * cell_size
+
+    first = 1
+    while first <= max_steps and active.size:
+        # Segments lengthen as rays retire, keeping the per-segment working set roughly constant.
+        length = max(RAY_MIN_SEGMENT_STEPS, RAY_SEGMENT_SAMPLES // active.size)
+        steps = np.arange(first, min(first + length, max_steps + 1), dtype=np.float64)
+        first += length
+        distance = steps[:, np.newaxis] * cell_size
+        xs = live.origin_x + live.unit_east * distance
+        ys = live.origin_y + live.unit_north * distance
+        # Affine inversion returns pixel-corner coordinates, while interpolation treats
+        # integer indices as pixel centers.
+        if north_up:
+            cols = inverse.a * xs + inverse.c - 0.5
+            rows = inverse.e * ys + inverse.f - 0.5
+        else:
+            cols = inverse.a * xs + inverse.b * ys + inverse.c - 0.5
+            rows = inverse.d * xs + inverse.e * ys + inverse.f - 0.5
+        inside = (rows >= 0) & (rows <= grid.height - 1) & (cols >= 0) & (cols <= grid.width - 1)
+
+        samples = _bilinear(grid.contiguous_elevations, rows, cols)
+        # A ray ends at the raster edge or at unknown terrain, which cannot safely be treated
+        # as transparent line of sight.
+        alive = np.logical_and.accumulate(inside & ~np.isnan(samples), axis=0)
+
+        # Distances grow along the segment, so it splits into a near phase inside the
+        # obstruction belt, where drops can satisfy clearance, and a far phase where
+        # obstacles stand obstruction_height tall.
+        near = int(np.searchsorted(distance[:, 0], obstruction_start, side="right"))
+        clear = clearances[active]
+        if near:
+            drops = live.ground - samples[:near] >= live.drop_required
+            clear |= np.any(alive[:near] & drops, axis=0)
+            clearances[active] = clear
+        if near < len(distance):
+            # Without the required drop, the view is capped where the obstruction belt begins.
+            blocked[active] = ~clear & alive[near]
+            samples[near:] += obstruction_height
+
+        slopes = (samples - live.viewer_height) / distance
+        slopes[~alive] = -np.inf
+        # A step is visible when its slope beats every slope before it along the ray.
+        previous_max = np.maximum.accumulate(
+            np.concatenate((running_max[np.newaxis, active], slopes[:-1])),
+            axis=0,
         )
-        if np.isnan(sample):
-            # Unknown terrain cannot safely be treated as transparent line of sight.
-            break
-
-        if distance <= obstruction_start and not clearance_met:
-            drop = candidate.elevation_m - sample
-            if drop >= drop_required:
-                clearance_met = True
-
-        obstacle_height = sample
-        if distance > obstruction_start:
-            if not clearance_met:
-                return obstruction_start, False
-            obstacle_height += obstruction_height
-
-        slope = (obstacle_height - viewer_height) / distance
-        if slope > max_slope:
-            max_slope = slope
-            visible_distance = distance
-
-    if not clearance_met:
-        return min(visible_distance, obstruction_start), False
-    return visible_distance, True
-
-
-def _signed_angular_offset(angle: float, center: float) -> float:
-    """Return the shortest signed offset from ``center`` in ``[-180, 180)``."""
-    return (angle - center + 180.0) % 360.0 - 180.0
-
-
-def _longest_clear_run(clear_rays: list[bool], *, circular: bool) -> int:
-    """Return the longest contiguous run of clear angular samples."""
-    if not clear_rays:
-        return 0
-
-    samples = clear_rays * 2 if circular else clear_rays
-    longest = 0
-    current = 0
-    for is_clear in samples:
-        current = current + 1 if is_clear else 0
-        longest = max(longest, current)
-    return min(longest, len(clear_rays))
+        records = slopes > previous_max
+        recorded = records.any(axis=0)
+        last_record = records.shape[0] - 1 - np.argmax(records[::-1], axis=0)
+        visible[active[recorded]] = distance[last_record[recorded], 0]
+        running_max[active] = np.maximum(previous_max[-1], slopes[-1])
+
+        next_distance = float(distance[-1, 0]) + cell_size
+        best_remaining = np.maximum(live.ceiling / next_distance, live.ceiling / last_distance)
+        settled = clear & (best_remaining <= running_max[active])
+        remaining = alive[-1] & ~blocked[active] & ~settled
+        active = active[remaining]
+        live = live.take(remaining)
+
+    return np.where(blocked, obstruction_start, visible), clearances
+
+
+def _bilinear(
+    elevations: NDArray[np.floating[Any]],
+    rows: NDArray[np.float64],
+    cols: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Bilinearly interpolate ``elevations`` at fractional pixel-center indices.
+
+    Indices past the raster edge are clamped to it. This is the arithmetic of
+    ``map_coordinates(order=1, mode="nearest")`` without its spline-filter setup and
+    per-call dispatch.
+    """
+    height, width = elevations.shape
+    rows = np.clip(rows, 0.0, height - 1)
+    cols = np.clip(cols, 0.0, width - 1)
+    top = rows.astype(np.intp)
+    left = cols.astype(np.intp)
+    row_weight = rows - top
+    col_weight = cols - left
+    flat = elevations.reshape(-1)
+    upper_left = top * width + left
+    lower_left = np.minimum(top + 1, height - 1) * width + left
+    right = np.minimum(left + 1, width - 1) - left
+    upper = flat[upper_left] * (1.0 - col_weight) + flat[upper_left + right] * col_weight
+    lower = flat[lower_left] * (1.0 - col_weight) + flat[lower_left + right] * col_weight
+    samples: NDArray[np.float64] = upper * (1.0 - row_weight) + lower * row_weight
+    return samples
+
+
+def _signed_angular_offset(angle: NDArray[np.float64], center: float) -> NDArray[np.float64]:
+    """Return the shortest signed offsets from ``center`` in ``[-180, 180)``."""
+    offset: NDArray[np.float64] = (angle - center + 180.0) % 360.0 - 180.0
+    return offset
+
+
+def _longest_clear_runs(clear_rays: NDArray[np.bool_], *, circular: bool) -> NDArray[np.intp]:
+    """Return the longest contiguous run of clear angular samples in each row."""
+    count = clear_rays.shape[1]
+    samples = np.concatenate((clear_rays, clear_rays), axis=1) if circular else clear_rays
+    # A sample's run length is its distance past the most recent blocked sample.
+    positions = np.arange(samples.shape[1])
+    last_blocked = np.maximum.accumulate(np.where(samples, -1, positions), axis=1)
+    run_lengths = positions - last_blocked
+    longest: NDArray[np.intp] = np.minimum(run_lengths.max(axis=1, initial=0), count)
+    return longest
@@ -4,21 +4,19 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
-from omegaconf import DictConfig, OmegaConf
 
-from highpoint.config import OutputConfig, VisibilityConfig, load_config
-from highpoint.data.discovery import DatasetNotFoundError
+from highpoint.config import OutputConfig, VisibilityConfig, load_config, load_yaml_mapping
 from highpoint.data.geocode import (
     GazetteerUnavailableError,
     TownGazetteer,
     TownNotFoundError,
 )
-from highpoint.pipeline import run_pipeline
-from highpoint.render.map import render_map
-from highpoint.reporting.report import emit_report
+
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
 
 app = typer.Typer(help="HighPoint: find drivable scenic viewpoints with clear visibility.")
 
@@ -139,19 +137,15 @@ def main(
     file_config: DictConfig | None = None
     if config_file:
         try:
-            loaded_config = OmegaConf.load(config_file)
+            file_config = load_yaml_mapping(config_file)
         except Exception as exc:
             raise typer.BadParameter(str(exc), param_hint="--config") from exc
-        if not isinstance(loaded_config, DictConfig):
-            raise typer.BadParameter(
-                f"Configuration file {config_file} must contain a YAML mapping.",
-                param_hint="--config",
-            )
-        file_config = loaded_config
 
     def get_from_file(path: str, default: Any = None) -> Any:
         if file_config is None:
             return default
+        from omegaconf import OmegaConf
+
         return OmegaConf.select(file_config, path, default=default)
 
     observer_lat = latitude if latitude is not None else get_from_file("observer.latitude")
@@ -248,6 +242,12 @@ def main(
     except (OSError, ValueError) as exc:
         raise typer.BadParameter(str(exc), param_hint="--config") from exc
 
+    # The pipeline pulls in rasterio, GeoPandas, and matplotlib. Importing them only once a run
+    # is about to start keeps --help and argument errors fast.
+    from highpoint.data.discovery import DatasetNotFoundError
+    from highpoint.pipeline import run_pipeline
+    from highpoint.reporting.report import emit_report
+
     logging.getLogger(__name__).info("Starting HighPoint pipeline")
     try:
         output = run_pipeline(config)
@@ -257,6 +257,8 @@ def main(
     emit_report(output.results, config)
 
     if config.output.render_png:
+        from highpoint.render.map import render_map
+
         render_map(output.results, terrain=output.terrain, output_path=config.output.render_png)
 
 
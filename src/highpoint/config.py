@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Self, cast
+from typing import TYPE_CHECKING, Any, Self, cast
 
-from omegaconf import DictConfig, OmegaConf
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+if TYPE_CHECKING:
+    from omegaconf import DictConfig
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
@@ -36,10 +40,51 @@ def output_root() -> Path:
     return root
 
 
+def load_yaml_mapping(path: Path) -> DictConfig:
+    """
+    Load an OmegaConf YAML mapping, reusing the parse while the file is unchanged.
+
+    Parses are cached per path, modification time, and size, so repeated runs in one process
+    (tests, notebooks, batch drivers) skip the YAML parser. Callers receive a private copy.
+    """
+    stat = path.stat()
+    return copy.deepcopy(_parse_yaml_mapping(path.resolve(), stat.st_mtime_ns, stat.st_size))
+
+
+def _load_yaml_container(path: Path) -> dict[str, Any]:
+    """Return a private plain-dict copy of a YAML mapping, leaving interpolations unresolved."""
+    stat = path.stat()
+    return copy.deepcopy(_yaml_container(path.resolve(), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _yaml_container(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    from omegaconf import OmegaConf
+
+    container = OmegaConf.to_container(_parse_yaml_mapping(path, mtime_ns, size), resolve=False)
+    return cast(dict[str, Any], container)
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_mapping(path: Path, _mtime_ns: int, _size: int) -> DictConfig:
+    # OmegaConf takes longer to import than the rest of this module; only YAML loading needs it,
+    # so --help and config-free runs skip it.
+    from omegaconf import DictConfig, OmegaConf
+
+    loaded = OmegaConf.load(path)
+    if not isinstance(loaded, DictConfig):
+        raise ValueError(f"Configuration file {path} must contain a YAML mapping.")
+    return loaded
+
+
 class ConfigModel(BaseModel):
-    """Base model that rejects misspelled or unsupported configuration keys."""
+    """
+    Base model that rejects misspelled or unsupported configuration keys.
 
-    model_config = ConfigDict(extra="forbid")
+    Configs are immutable once validated; use ``model_copy(update=...)`` to derive variants.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class TerrainConfig(ConfigModel):
@@ -149,10 +194,12 @@ class AppConfig(ConfigModel):
     """Top-level configuration for the HighPoint pipeline."""
 
     observer: ObserverInput
-    terrain: TerrainConfig = Field(default_factory=TerrainConfig)
-    roads: RoadConfig = Field(default_factory=RoadConfig)
-    visibility: VisibilityConfig = Field(default_factory=VisibilityConfig)
-    output: OutputConfig = Field(default_factory=OutputConfig)
+    # Sections are frozen, so omitted ones share one default instance instead of being
+    # rebuilt and validated for every config.
+    terrain: TerrainConfig = Field(default=TerrainConfig())
+    roads: RoadConfig = Field(default=RoadConfig())
+    visibility: VisibilityConfig = Field(default=VisibilityConfig())
+    output: OutputConfig = Field(default=OutputConfig())
 
 
 def load_config(
@@ -188,48 +235,85 @@ def load_config(
         },
     }
 
-    config_cfg = OmegaConf.create({})
-
-    if config_path:
-        file_cfg = OmegaConf.load(config_path)
-        if not isinstance(file_cfg, DictConfig):
-            raise ValueError(f"Configuration file {config_path} must contain a YAML mapping.")
-        config_cfg = cast(DictConfig, OmegaConf.merge(config_cfg, file_cfg))
+    config_dict = _load_yaml_container(config_path) if config_path else {}
 
     # Primitive arguments originate at the CLI (or its resolved defaults) and therefore
     # must take precedence over values loaded from YAML.
-    config_cfg = cast(DictConfig, OmegaConf.merge(config_cfg, cli_values))
+    _deep_merge(config_dict, cli_values)
 
     if overrides:
         for dotted_key, value in overrides.items():
             if value is None:
                 continue
             converted = str(value) if isinstance(value, Path) else value
-            OmegaConf.update(config_cfg, dotted_key, converted, merge=True)
+            _apply_override(config_dict, dotted_key, converted)
 
-    container = OmegaConf.to_container(config_cfg, resolve=True)
-    if not isinstance(container, dict):  # pragma: no cover - guarded by DictConfig above
-        raise ValueError("Merged configuration must be a mapping.")
-    config_dict = cast(dict[str, Any], container)
+    # Merging plain dicts skips OmegaConf's node construction. Files that use interpolation
+    # are resolved only after merging, so their references still see the CLI values.
+    if _has_interpolation(config_dict):
+        from omegaconf import OmegaConf
+
+        container = OmegaConf.to_container(OmegaConf.create(config_dict), resolve=True)
+        config_dict = cast(dict[str, Any], container)
     config = AppConfig.model_validate(config_dict)
     return _resolve_relative_paths(config)
 
 
+def _deep_merge(base: dict[str, Any], extra: dict[str, Any]) -> dict[str, Any]:
+    """Merge ``extra`` into ``base`` in place, combining nested mappings key by key."""
+    pending = [(base, extra)]
+    while pending:
+        target, source = pending.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                pending.append((current, value))
+            else:
+                target[key] = value
+    return base
+
+
+def _apply_override(config: dict[str, Any], dotted_key: str, value: Any) -> None:
+    """Set ``value`` at ``dotted_key``, creating intermediate sections as needed."""
+    *parents, leaf = dotted_key.split(".")
+    section = config
+    for key in parents:
+        child = section.get(key)
+        if not isinstance(child, dict):
+            child = section[key] = {}
+        section = child
+    current = section.get(leaf)
+    if isinstance(current, dict) and isinstance(value, dict):
+        _deep_merge(current, value)
+    else:
+        section[leaf] = value
+
+
+def _has_interpolation(value: Any) -> bool:
+    if isinstance(value, str):
+        return "${" in value
+    if isinstance(value, dict):
+        return any(_has_interpolation(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_has_interpolation(item) for item in value)
+    return False
+
+
 def _resolve_relative_paths(config: AppConfig) -> AppConfig:
-    input_root = data_root()
     updates: dict[str, Any] = {}
 
-    terrain_path = config.terrain.data_path
-    if terrain_path is not None:
-        terrain_resolved = _resolve_data_path(terrain_path, input_root)
-        if terrain_resolved != terrain_path:
-            updates["terrain"] = config.terrain.model_copy(update={"data_path": terrain_resolved})
-
-    road_path = config.roads.data_path
-    if road_path is not None:
-        road_resolved = _resolve_data_path(road_path, input_root)
-        if road_resolved != road_path:
-            updates["roads"] = config.roads.model_copy(update={"data_path": road_resolved})
+    data_sections: dict[str, TerrainConfig | RoadConfig] = {
+        "terrain": config.terrain,
+        "roads": config.roads,
+    }
+    if any(section.data_path is not None for section in data_sections.values()):
+        input_root = data_root()
+        for name, section in data_sections.items():
+            if section.data_path is None:
+                continue
+            resolved = _resolve_data_path(section.data_path, input_root)
+            if resolved != section.data_path:
+                updates[name] = section.model_copy(update={"data_path": resolved})
 
     output_paths = {
         "export_csv": config.output.export_csv,
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from collections.abc import Sequence
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Generic, TypeVar
 
 import numpy as np
+import pyogrio
 import rasterio
+from numpy.typing import NDArray
 from pyproj import Geod
 from rasterio.crs import CRS
 from rasterio.merge import merge as raster_merge
@@ -17,16 +23,11 @@ from rasterio.transform import Affine, array_bounds
 from rasterio.warp import (
     Resampling as WarpResampling,
 )
-from rasterio.warp import (
-    calculate_default_transform,
-    reproject,
-    transform_bounds,
-)
+from rasterio.warp import calculate_default_transform, reproject
 
 from highpoint.config import PROJECT_ROOT, data_root
-from highpoint.data.roads import _looks_projected, _read_geo_dataframe
-from highpoint.data.terrain import TerrainGrid
-from highpoint.utils import utm_epsg_for_latlon
+from highpoint.data.terrain import WARP_MEMORY_LIMIT_MB, TerrainGrid
+from highpoint.utils import cached_transformer, utm_epsg_for_latlon
 
 LOG = logging.getLogger(__name__)
 GEOD = Geod(ellps="WGS84")
@@ -54,6 +55,54 @@ class RoadAsset:
     bounds: tuple[float, float, float, float]
 
 
+_Asset = TypeVar("_Asset", TerrainAsset, RoadAsset)
+
+
+@dataclass(frozen=True, eq=False)
+class _AssetCatalog(Generic[_Asset]):
+    """
+    Scanned assets with their lat/lon bounds stacked for window queries.
+
+    Each query is one vectorized overlap test, so lookups stay cheap as the tile cache grows.
+    """
+
+    assets: tuple[_Asset, ...]
+    bounds: NDArray[np.float64]
+
+    @classmethod
+    def build(cls, assets: Sequence[_Asset]) -> _AssetCatalog[_Asset]:
+        bounds = np.array([asset.bounds for asset in assets], dtype=np.float64).reshape(-1, 4)
+        return cls(assets=tuple(assets), bounds=bounds)
+
+    def intersecting(self, window: SearchBounds) -> list[_Asset]:
+        """Return the assets that overlap ``window`` with positive area, in scan order."""
+        return [self.assets[index] for index in np.flatnonzero(self._overlaps(window))]
+
+    def best_covering(self, window: SearchBounds) -> _Asset | None:
+        """Return the overlapping asset covering most of ``window``; ties keep scan order."""
+        overlaps = np.flatnonzero(self._overlaps(window))
+        if not overlaps.size:
+            return None
+        lat_min, lat_max, lon_min, lon_max = window
+        bounds = self.bounds[overlaps]
+        lat_overlap = np.minimum(bounds[:, 1], lat_max) - np.maximum(bounds[:, 0], lat_min)
+        lon_overlap = np.minimum(bounds[:, 3], lon_max) - np.maximum(bounds[:, 2], lon_min)
+        # Every row overlaps with positive area, so the window's area is a common divisor and
+        # ranking by the raw overlap area picks the same asset as ranking by coverage fraction.
+        return self.assets[int(overlaps[np.argmax(lat_overlap * lon_overlap)])]
+
+    def _overlaps(self, window: SearchBounds) -> NDArray[np.bool_]:
+        lat_min, lat_max, lon_min, lon_max = window
+        overlaps: NDArray[np.bool_] = (
+            (self.bounds[:, 1] > lat_min)
+            & (self.bounds[:, 0] < lat_max)
+            & (self.bounds[:, 3] > lon_min)
+            & (self.bounds[:, 2] < lon_max)
+        )
+        return overlaps
+
+
+@lru_cache(maxsize=128)
 def compute_search_bounds(latitude: float, longitude: float, radius_km: float) -> SearchBounds:
     """Compute a latitude/longitude bounding box around a point with a radius in km."""
     radius_m = radius_km * 1000.0
@@ -83,9 +132,9 @@ def discover_terrain_paths(
     """
     bounds = compute_search_bounds(latitude, longitude, radius_km)
     directories = _terrain_directories(search_dirs)
-    entries = _terrain_entries(tuple(str(path) for path in directories))
+    catalog = _terrain_entries(tuple(str(path) for path in directories))
 
-    candidates = [asset for asset in entries if _bounds_intersect(asset.bounds, bounds)]
+    candidates = catalog.intersecting(bounds)
 
     if not candidates:
         message = _missing_terrain_message(
@@ -124,54 +173,65 @@ def load_terrain_grid(
         raise DatasetNotFoundError("terrain", "At least one DEM path is required.")
     if resolution_scale <= 0.0:
         raise ValueError("resolution_scale must be positive")
-    datasets = [rasterio.open(path) for path in paths]
+    with rasterio.open(paths[0]) as first:
+        source_crs = first.crs
+    if source_crs is None:
+        raise DatasetNotFoundError(
+            "terrain",
+            f"DEM {paths[0]} is missing CRS metadata.",
+        )
+    lat_min, lat_max, lon_min, lon_max = bounds_latlon
+    bounds_source = cached_transformer("EPSG:4326", source_crs.to_wkt()).transform_bounds(
+        lon_min,
+        lat_min,
+        lon_max,
+        lat_max,
+        densify_pts=21,
+    )
+    # Given paths, merge opens each tile only while reading from it rather than pinning a
+    # handle for every tile across both attempts.
     try:
-        source_crs = datasets[0].crs
-        if source_crs is None:
-            raise DatasetNotFoundError(
-                "terrain",
-                f"DEM {paths[0]} is missing CRS metadata.",
-            )
-        lat_min, lat_max, lon_min, lon_max = bounds_latlon
-        bounds_source = transform_bounds(
-            "EPSG:4326",
-            source_crs,
-            lon_min,
-            lat_min,
-            lon_max,
-            lat_max,
-            densify_pts=21,
+        merged, transform = raster_merge(
+            list(paths),
+            bounds=bounds_source,
+            nodata=np.nan,
+            dtype=np.float32,
         )
-        try:
-            merged, transform = raster_merge(
-                datasets,
-                bounds=bounds_source,
-                nodata=np.nan,
-                dtype=np.float32,
-            )
-        except ValueError:
-            LOG.debug(
-                "Bounds %s produced empty mosaic; falling back to full extent.",
-                bounds_latlon,
-            )
-            merged, transform = raster_merge(datasets, nodata=np.nan, dtype=np.float32)
-    finally:
-        for dataset in datasets:
-            dataset.close()
+    except ValueError:
+        LOG.debug(
+            "Bounds %s produced empty mosaic; falling back to full extent.",
+            bounds_latlon,
+        )
+        merged, transform = raster_merge(list(paths), nodata=np.nan, dtype=np.float32)
 
-    array = merged[0].astype(np.float32)
+    # merge already produced float32; take the band as a view instead of copying the mosaic.
+    array = merged[0].astype(np.float32, copy=False)
     out_transform = transform
     current_crs = source_crs
 
-    if CRS.from_user_input(current_crs).to_string() != target_crs:
-        bounds_proj = array_bounds(array.shape[0], array.shape[1], out_transform)
-        dest_transform, dest_width, dest_height = calculate_default_transform(
-            current_crs,
-            target_crs,
-            array.shape[1],
-            array.shape[0],
-            *bounds_proj,
-        )
+    reprojecting = CRS.from_user_input(current_crs).to_string() != target_crs
+    if reprojecting or resolution_scale != 1.0:
+        if reprojecting:
+            bounds_proj = array_bounds(array.shape[0], array.shape[1], out_transform)
+            dest_transform, dest_width, dest_height = calculate_default_transform(
+                current_crs,
+                target_crs,
+                array.shape[1],
+                array.shape[0],
+                *bounds_proj,
+            )
+        else:
+            dest_transform, dest_width, dest_height = out_transform, array.shape[1], array.shape[0]
+        # Rescaling is folded into the same warp so the mosaic is streamed through GDAL once.
+        if resolution_scale != 1.0:
+            scale = 1.0 / resolution_scale
+            out_height = max(1, int(round(dest_height * scale)))
+            out_width = max(1, int(round(dest_width * scale)))
+            dest_transform = dest_transform * Affine.scale(
+                dest_width / out_width,
+                dest_height / out_height,
+            )
+            dest_width, dest_height = out_width, out_height
         destination = np.full((dest_height, dest_width), np.nan, dtype=np.float32)
         reproject(
             source=array,
@@ -179,39 +239,19 @@ def load_terrain_grid(
             src_transform=out_transform,
             src_crs=current_crs,
             dst_transform=dest_transform,
-            dst_crs=target_crs,
+            dst_crs=target_crs if reprojecting else current_crs,
             src_nodata=np.nan,
-            resampling=WarpResampling.bilinear,
+            resampling=(
+                WarpResampling.average if resolution_scale > 1.0 else WarpResampling.bilinear
+            ),
             dst_nodata=np.nan,
-            num_threads=1,
+            num_threads=os.cpu_count() or 1,
+            warp_mem_limit=WARP_MEMORY_LIMIT_MB,
         )
         array = destination
         out_transform = dest_transform
-        current_crs = target_crs
-
-    if resolution_scale != 1.0:
-        scale = 1.0 / resolution_scale
-        out_height = max(1, int(round(array.shape[0] * scale)))
-        out_width = max(1, int(round(array.shape[1] * scale)))
-        destination = np.full((out_height, out_width), np.nan, dtype=np.float32)
-        scaled_transform = out_transform * Affine.scale(
-            array.shape[1] / out_width,
-            array.shape[0] / out_height,
-        )
-        reproject(
-            source=array,
-            destination=destination,
-            src_transform=out_transform,
-            src_crs=current_crs,
-            dst_transform=scaled_transform,
-            dst_crs=current_crs,
-            src_nodata=np.nan,
-            resampling=WarpResampling.average,
-            dst_nodata=np.nan,
-            num_threads=1,
-        )
-        array = destination
-        out_transform = scaled_transform
+        if reprojecting:
+            current_crs = target_crs
 
     crs_value = (
         current_crs
@@ -242,15 +282,11 @@ def discover_roads_path(
     bounds = compute_search_bounds(latitude, longitude, radius_km)
     directories = _roads_directories(search_dirs)
     approx_epsg = utm_epsg_for_latlon(latitude, longitude)
-    entries = _road_entries(tuple(str(path) for path in directories), approx_epsg)
+    catalog = _road_entries(tuple(str(path) for path in directories), approx_epsg)
 
-    covering: list[tuple[RoadAsset, float]] = []
-    for asset in entries:
-        if _bounds_intersect(asset.bounds, bounds):
-            coverage = _coverage_fraction(asset.bounds, bounds)
-            covering.append((asset, coverage))
+    best_asset = catalog.best_covering(bounds)
 
-    if not covering:
+    if best_asset is None:
         message = _missing_roads_message(
             latitude,
             longitude,
@@ -261,8 +297,6 @@ def discover_roads_path(
         )
         raise DatasetNotFoundError("roads", message)
 
-    covering.sort(key=lambda item: item[1], reverse=True)
-    best_asset = covering[0][0]
     LOG.debug(
         "Resolved road dataset %s for %.4f°, %.4f° radius %.1f km",
         best_asset.path,
@@ -338,38 +372,170 @@ def _roads_directories(search_dirs: Sequence[Path] | None) -> list[Path]:
 
 
 @lru_cache(maxsize=4)
-def _terrain_entries(dir_key: tuple[str, ...]) -> list[TerrainAsset]:
-    entries: list[TerrainAsset] = []
-    for directory_str in dir_key:
-        directory = Path(directory_str)
-        if not directory.exists():
-            continue
-        for pattern in ("*.tif", "*.tiff"):
-            for path in directory.rglob(pattern):
-                try:
-                    bounds = _raster_bounds_latlon(path)
-                except Exception as exc:  # pragma: no cover - corrupted or unsupported files
-                    LOG.debug("Skipping terrain candidate %s (%s)", path, exc)
-                    continue
-                entries.append(TerrainAsset(path=path, bounds=bounds))
-    return entries
+def _terrain_entries(dir_key: tuple[str, ...]) -> _AssetCatalog[TerrainAsset]:
+    paths = _files_with_suffix(dir_key, (".tif", ".tiff"))
+    scanned = _indexed_bounds(
+        paths,
+        _BoundsIndex(_bounds_index_path("terrain")),
+        _raster_bounds_latlon,
+        label="terrain",
+    )
+    return _AssetCatalog.build([TerrainAsset(path=path, bounds=bounds) for path, bounds in scanned])
+
+
+@lru_cache(maxsize=16)
+def _road_entries(dir_key: tuple[str, ...], approx_epsg: int) -> _AssetCatalog[RoadAsset]:
+    # Unreferenced projected files are scanned once in native coordinates and placed in the
+    # observer's UTM zone here, so queries from other zones reuse the same scan.
+    assets = [
+        RoadAsset(
+            path=path,
+            bounds=_native_bounds_to_latlon(bounds, approx_epsg) if _is_native(bounds) else bounds,
+        )
+        for path, bounds in _road_scan(dir_key)
+    ]
+    return _AssetCatalog.build(assets)
 
 
 @lru_cache(maxsize=4)
-def _road_entries(dir_key: tuple[str, ...], approx_epsg: int) -> list[RoadAsset]:
-    entries: list[RoadAsset] = []
-    for directory_str in dir_key:
-        directory = Path(directory_str)
-        if not directory.exists():
+def _road_scan(dir_key: tuple[str, ...]) -> tuple[tuple[Path, SearchBounds], ...]:
+    paths = _files_with_suffix(dir_key, (".geojson",))
+    scanned = _indexed_bounds(
+        paths,
+        _BoundsIndex(_bounds_index_path("roads")),
+        _vector_bounds,
+        label="road",
+    )
+    return tuple(scanned)
+
+
+def _existing_directories(dir_key: tuple[str, ...]) -> list[Path]:
+    return [Path(directory) for directory in dir_key if Path(directory).exists()]
+
+
+def _files_with_suffix(dir_key: tuple[str, ...], suffixes: tuple[str, ...]) -> list[Path]:
+    """Return files under the existing directories whose names end with one of ``suffixes``."""
+    # One walk per tree serves every suffix, where rglob would traverse it once per pattern.
+    return [
+        Path(root, name)
+        for directory in _existing_directories(dir_key)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.endswith(suffixes)
+    ]
+
+
+def _bounds_index_path(name: str) -> Path:
+    return data_root() / "index" / f"{name}_bounds.json"
+
+
+class _BoundsIndex:
+    """
+    On-disk record of dataset lat/lon bounds keyed by path, size, and mtime.
+
+    Probing a file's bounds opens it and transforms its extent, so fresh processes reuse the
+    bounds recorded by earlier scans and only probe new or modified files. A missing or
+    unreadable index behaves like an empty one.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries = self._load(path)
+        self._modified = False
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, dict[str, Any]]:
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(loaded, dict):
+            return {}
+        return {key: value for key, value in loaded.items() if isinstance(value, dict)}
+
+    def lookup(self, key: str, stat: os.stat_result) -> SearchBounds | None:
+        """Return the recorded bounds when the file is unchanged since it was probed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.get("size") != stat.st_size or entry.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        bounds = entry.get("bounds")
+        if not isinstance(bounds, list) or len(bounds) != 4:
+            return None
+        lat_min, lat_max, lon_min, lon_max = (float(value) for value in bounds)
+        return (lat_min, lat_max, lon_min, lon_max)
+
+    def record(self, key: str, stat: os.stat_result, bounds: SearchBounds) -> None:
+        self._entries[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "bounds": list(bounds),
+        }
+        self._modified = True
+
+    def save(self) -> None:
+        """Atomically persist the index when a scan probed new files."""
+        if not self._modified:
+            return
+        payload = json.dumps(self._entries, indent=2, sort_keys=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.part")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(payload, encoding="utf-8")
+            temporary.replace(self.path)
+        except OSError as exc:
+            LOG.debug("Could not persist dataset index %s (%s)", self.path, exc)
+            temporary.unlink(missing_ok=True)
+            return
+        self._modified = False
+
+
+def _indexed_bounds(
+    paths: Iterable[Path],
+    index: _BoundsIndex,
+    probe: Callable[[Path], SearchBounds],
+    *,
+    label: str,
+) -> list[tuple[Path, SearchBounds]]:
+    """Return each readable path with its bounds, probing only files missing from ``index``."""
+    known: dict[Path, SearchBounds] = {}
+    misses: list[tuple[Path, str, os.stat_result]] = []
+    ordered = list(paths)
+    for path in ordered:
+        try:
+            stat = path.stat()
+        except OSError as exc:  # pragma: no cover - file vanished during the scan
+            LOG.debug("Skipping %s candidate %s (%s)", label, path, exc)
             continue
-        for path in directory.rglob("*.geojson"):
-            try:
-                bounds = _vector_bounds_latlon(path, approx_epsg)
-            except Exception as exc:  # pragma: no cover - corrupted or unsupported files
-                LOG.debug("Skipping road candidate %s (%s)", path, exc)
-                continue
-            entries.append(RoadAsset(path=path, bounds=bounds))
-    return entries
+        key = str(path.absolute())
+        bounds = index.lookup(key, stat)
+        if bounds is None:
+            misses.append((path, key, stat))
+        else:
+            known[path] = bounds
+
+    def safe_probe(path: Path) -> SearchBounds | None:
+        try:
+            return probe(path)
+        except Exception as exc:  # pragma: no cover - corrupted or unsupported files
+            LOG.debug("Skipping %s candidate %s (%s)", label, path, exc)
+            return None
+
+    # Opening a dataset is dominated by file I/O and GDAL work that releases the GIL, so a cold
+    # scan over many tiles overlaps the probes instead of paying each open in turn.
+    workers = min(len(misses), os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bounds") as executor:
+            probed = list(executor.map(safe_probe, [path for path, _, _ in misses]))
+    else:
+        probed = [safe_probe(path) for path, _, _ in misses]
+    for (path, key, stat), bounds in zip(misses, probed, strict=True):
+        if bounds is not None:
+            index.record(key, stat, bounds)
+            known[path] = bounds
+    index.save()
+    return [(path, known[path]) for path in ordered if path in known]
 
 
 def _raster_bounds_latlon(path: Path) -> tuple[float, float, float, float]:
@@ -378,101 +544,55 @@ def _raster_bounds_latlon(path: Path) -> tuple[float, float, float, float]:
         dataset_crs = dataset.crs
         if dataset_crs is None:
             raise ValueError(f"Raster at {path} has no CRS.")
-        bounds_latlon = transform_bounds(dataset_crs, "EPSG:4326", *dataset_bounds, densify_pts=21)
-    lat_min, lon_min, lat_max, lon_max = (
-        bounds_latlon[1],
-        bounds_latlon[0],
-        bounds_latlon[3],
-        bounds_latlon[2],
-    )
-    return (lat_min, lat_max, lon_min, lon_max)
+    return _bounds_to_latlon(dataset_crs.to_wkt(), dataset_bounds)
 
 
-def _vector_bounds_latlon(path: Path, approx_epsg: int) -> tuple[float, float, float, float]:
-    gdf = _read_geo_dataframe(path, rows=0)
-    if gdf.empty:
-        gdf = _read_geo_dataframe(path)
-    if gdf.empty:
+def _vector_bounds(path: Path) -> SearchBounds:
+    """
+    Return the lat/lon bounds of a vector dataset.
+
+    Files whose coordinates are projected but carry no usable CRS get their native
+    ``(y_min, y_max, x_min, x_max)`` instead; ``RoadNetwork.from_geojson`` places such data in
+    the observer's UTM zone, which is only known per query.
+    """
+    # OGR reports the layer CRS and extent directly, without building a GeoDataFrame.
+    info = pyogrio.read_info(path, force_total_bounds=True)
+    total_bounds = info.get("total_bounds")
+    if not info.get("features") or total_bounds is None or not np.all(np.isfinite(total_bounds)):
         raise ValueError(f"Vector dataset at {path} contains no geometries.")
-    src_crs = gdf.crs
-    vector_bounds = gdf.total_bounds
-    if src_crs is None:
-        assumed = CRS.from_epsg(approx_epsg)
-        bounds_latlon = transform_bounds(
-            assumed,
-            "EPSG:4326",
-            *vector_bounds,
-            densify_pts=21,
-        )
-    else:
-        epsg = src_crs.to_epsg() if hasattr(src_crs, "to_epsg") else None
-        if epsg in {4326, 4979} and _looks_projected(gdf):
-            assumed = CRS.from_epsg(approx_epsg)
-            bounds_latlon = transform_bounds(
-                assumed,
-                "EPSG:4326",
-                *vector_bounds,
-                densify_pts=21,
-            )
-        else:
-            bounds_latlon = transform_bounds(
-                src_crs,
-                "EPSG:4326",
-                *vector_bounds,
-                densify_pts=21,
-            )
-    lat_min, lon_min, lat_max, lon_max = (
-        bounds_latlon[1],
-        bounds_latlon[0],
-        bounds_latlon[3],
-        bounds_latlon[2],
-    )
-    return (lat_min, lat_max, lon_min, lon_max)
+    x_min, y_min, x_max, y_max = (float(value) for value in total_bounds)
+    native = (y_min, y_max, x_min, x_max)
+    src_crs: str | None = info.get("crs")
+    if src_crs is None or (
+        CRS.from_user_input(src_crs).to_epsg() in {4326, 4979} and _is_native(native)
+    ):
+        # Unreferenced coordinates are lat/lon unless they look projected (see _is_native).
+        return native
+    return _bounds_to_latlon(src_crs, (x_min, y_min, x_max, y_max))
 
 
-def _grid_bounds_latlon(grid: TerrainGrid) -> tuple[float, float, float, float]:
-    bounds_projected = array_bounds(grid.height, grid.width, grid.transform)
-    projected = (
-        bounds_projected[0],
-        bounds_projected[1],
-        bounds_projected[2],
-        bounds_projected[3],
-    )
-    transformed = transform_bounds(grid.crs, "EPSG:4326", *projected, densify_pts=21)
-    lat_min, lon_min, lat_max, lon_max = (
-        transformed[1],
-        transformed[0],
-        transformed[3],
-        transformed[2],
-    )
-    return (lat_min, lat_max, lon_min, lon_max)
+def _is_native(bounds: SearchBounds) -> bool:
+    """Whether ``bounds`` came from ``_vector_bounds`` as native projected coordinates."""
+    return any(abs(value) > 360 for value in bounds)
 
 
-def _bounds_intersect(a: SearchBounds, b: SearchBounds) -> bool:
-    a_lat_min, a_lat_max, a_lon_min, a_lon_max = a
-    b_lat_min, b_lat_max, b_lon_min, b_lon_max = b
-    return not (
-        a_lat_max <= b_lat_min
-        or a_lat_min >= b_lat_max
-        or a_lon_max <= b_lon_min
-        or a_lon_min >= b_lon_max
-    )
+def _native_bounds_to_latlon(bounds: SearchBounds, epsg: int) -> SearchBounds:
+    y_min, y_max, x_min, x_max = bounds
+    return _bounds_to_latlon(f"EPSG:{epsg}", (x_min, y_min, x_max, y_max))
 
 
-def _coverage_fraction(dataset_bounds: SearchBounds, request_bounds: SearchBounds) -> float:
-    lat_overlap = max(
-        0.0,
-        min(dataset_bounds[1], request_bounds[1]) - max(dataset_bounds[0], request_bounds[0]),
-    )
-    lon_overlap = max(
-        0.0,
-        min(dataset_bounds[3], request_bounds[3]) - max(dataset_bounds[2], request_bounds[2]),
-    )
-    area_overlap = lat_overlap * lon_overlap
-    request_area = (request_bounds[1] - request_bounds[0]) * (request_bounds[3] - request_bounds[2])
-    if request_area == 0.0:
-        return 0.0
-    return area_overlap / request_area
+def _grid_bounds_latlon(grid: TerrainGrid) -> tuple[float, float, float, float]:
+    return _bounds_to_latlon(grid.crs, array_bounds(grid.height, grid.width, grid.transform))
+
+
+def _bounds_to_latlon(source_crs: str, bounds: Sequence[float]) -> SearchBounds:
+    """Project ``(west, south, east, north)`` bounds in ``source_crs`` to lat/lon order."""
+    west, south, east, north = bounds
+    lon_min, lat_min, lon_max, lat_max = cached_transformer(
+        source_crs,
+        "EPSG:4326",
+    ).transform_bounds(west, south, east, north, densify_pts=21)
+    return (lat_min, lat_max, lon_min, lon_max)
 
 
 def _bounds_contains(
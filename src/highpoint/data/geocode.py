@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import csv
 import logging
 import os
@@ -14,6 +15,7 @@ from pathlib import Path
 from highpoint.config import PROJECT_ROOT, data_root
 
 LOG = logging.getLogger(__name__)
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
 
 STATE_ABBREVIATIONS = {
     "ALABAMA": "AL",
@@ -74,6 +76,10 @@ STATE_ABBREVIATIONS = {
     "WISCONSIN": "WI",
     "WYOMING": "WY",
 }
+_STATE_BY_NORMALIZED_NAME = {
+    _NON_ALPHANUMERIC.sub(" ", name.lower()).strip(): abbrev
+    for name, abbrev in STATE_ABBREVIATIONS.items()
+}
 
 
 @dataclass(frozen=True)
@@ -87,6 +93,19 @@ class TownRecord:
     elevation_m: float | None
 
 
+# (name, state, latitude, longitude, elevation_m), in TownRecord field order.
+_TownRow = tuple[str, str, float, float, float | None]
+
+
+@dataclass(frozen=True)
+class _GazetteerIndex:
+    """Town records keyed by normalized (name, state), plus sorted names per state."""
+
+    entries: dict[tuple[str, str], list[_TownRow]]
+    # Normalized names sorted per state, paired with the display name, for prefix searches.
+    names_by_state: dict[str, list[tuple[str, str]]]
+
+
 class TownNotFoundError(LookupError):
     """Raised when the gazetteer cannot resolve the requested town."""
 
@@ -107,7 +126,7 @@ class GazetteerUnavailableError(FileNotFoundError):
 class TownGazetteer:
     """Loads a GNIS-derived dataset and resolves town/state pairs."""
 
-    _state_abbrev = STATE_ABBREVIATIONS
+    _state_abbrev = _STATE_BY_NORMALIZED_NAME
 
     def __init__(self, dataset_path: Path | None = None) -> None:
         self.dataset_path = dataset_path or self._default_dataset_path()
@@ -116,8 +135,9 @@ class TownGazetteer:
                 f"Offline gazetteer not found at {self.dataset_path}. "
                 "Run `python scripts/fetch_gazetteer.py` to download USGS GNIS data.",
             )
-        self._entries = self._load_entries(self.dataset_path)
-        self._keys = set(self._entries)
+        # Keying the cache on mtime picks up a refreshed CSV without restarting the process.
+        modified_ns = self.dataset_path.stat().st_mtime_ns
+        self._index = self._load_entries(self.dataset_path, modified_ns)
 
     @staticmethod
     def _default_dataset_path() -> Path:
@@ -132,62 +152,71 @@ class TownGazetteer:
         return repo_candidate
 
     @classmethod
-    @lru_cache(maxsize=1)
-    def _load_entries(cls, dataset_path: Path) -> dict[tuple[str, str], list[TownRecord]]:
-        index: dict[tuple[str, str], list[TownRecord]] = {}
-        with dataset_path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
+    @lru_cache(maxsize=2)
+    def _load_entries(
+        cls,
+        dataset_path: Path,
+        _modified_ns: int,
+    ) -> _GazetteerIndex:
+        index: dict[tuple[str, str], list[_TownRow]] = {}
+        with dataset_path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, [])
             required = {"name", "state", "latitude", "longitude"}
-            if not required.issubset(reader.fieldnames or []):
+            if not required.issubset(header):
                 raise ValueError(
                     f"Gazetteer file {dataset_path} missing required columns: {sorted(required)}",
                 )
+            name_idx, state_idx, lat_idx, lon_idx = (
+                header.index(column) for column in ("name", "state", "latitude", "longitude")
+            )
+            elev_idx = header.index("elevation_m") if "elevation_m" in header else None
+            normalize = cls._normalize
             for row in reader:
                 try:
-                    name = row["name"].strip()
-                    state = row["state"].strip().upper()
-                    lat = float(row["latitude"])
-                    lon = float(row["longitude"])
-                except (KeyError, ValueError) as exc:  # pragma: no cover - defensive
+                    name = row[name_idx].strip()
+                    state = row[state_idx].strip().upper()
+                    lat = float(row[lat_idx])
+                    lon = float(row[lon_idx])
+                except (IndexError, ValueError) as exc:  # pragma: no cover - defensive
                     LOG.debug("Skipping invalid gazetteer row %s (%s)", row, exc)
                     continue
-                elev_raw = row.get("elevation_m", "") if row.get("elevation_m") is not None else ""
+                elev_raw = row[elev_idx] if elev_idx is not None and elev_idx < len(row) else ""
                 try:
                     elevation = float(elev_raw) if elev_raw != "" else None
                 except ValueError:
                     elevation = None
-                key = (cls._normalize(name), state)
-                record = TownRecord(
-                    name=name,
-                    state=state,
-                    latitude=lat,
-                    longitude=lon,
-                    elevation_m=elevation,
-                )
-                index.setdefault(key, []).append(record)
-        return index
+                # Rows stay plain tuples; only the matched row becomes a TownRecord.
+                row_record = (name, state, lat, lon, elevation)
+                index.setdefault((normalize(name), state), []).append(row_record)
+        names_by_state: dict[str, list[tuple[str, str]]] = {}
+        for (normalized, state), rows in index.items():
+            names_by_state.setdefault(state, []).append((normalized, rows[0][0]))
+        for names in names_by_state.values():
+            names.sort()
+        return _GazetteerIndex(entries=index, names_by_state=names_by_state)
 
     @staticmethod
     def _normalize(text: str) -> str:
-        return re.sub(r"[^a-z0-9]+", " ", text.strip().lower()).strip()
+        return _NON_ALPHANUMERIC.sub(" ", text.strip().lower()).strip()
 
     def resolve(self, query: str) -> TownRecord:
         """Return a single TownRecord for ``query`` such as ``'Issaquah, WA'``."""
         name, state = self._parse_query(query)
-        key = (self._normalize(name), state)
-        matches = self._entries.get(key)
+        prefix = self._normalize(name)
+        matches = self._index.entries.get((prefix, state))
         if matches:
-            return matches[0]
+            return TownRecord(*matches[0])
 
         suggestions = []
-        for candidate_key, records in self._entries.items():
-            cand_name, cand_state = candidate_key
-            if cand_state != state:
-                continue
-            if cand_name.startswith(self._normalize(name)):
-                suggestions.append(f"{records[0].name}, {cand_state}")
+        names = self._index.names_by_state.get(state, [])
+        position = bisect.bisect_left(names, (prefix,))
+        for normalized, display in names[position : position + 5]:
+            if not normalized.startswith(prefix):
+                break
+            suggestions.append(f"{display}, {state}")
 
-        raise TownNotFoundError(query, suggestions[:5])
+        raise TownNotFoundError(query, suggestions)
 
     def _parse_query(self, query: str) -> tuple[str, str]:
         if not query or not query.strip():
@@ -208,11 +237,10 @@ class TownGazetteer:
         state_clean = state_text.strip().upper()
         if len(state_clean) == 2 and state_clean.isalpha():
             return state_clean
-        normalized_query = self._normalize(state_text)
-        for name, abbrev in self._state_abbrev.items():
-            if normalized_query == self._normalize(name):
-                return abbrev
-        raise TownNotFoundError(state_text)
+        abbrev = self._state_abbrev.get(self._normalize(state_text))
+        if abbrev is None:
+            raise TownNotFoundError(state_text)
+        return abbrev
 
 
 def resolve_town(query: str, dataset_path: Path | None = None) -> TownRecord:
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import hashlib
+import logging
+import math
+import os
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
+import shapely
+from numpy.typing import NDArray
 from shapely.geometry import LineString, MultiLineString
 
+LOG = logging.getLogger(__name__)
+
+# Networks with fewer segments are scanned in full; a spatial index query costs more than the
+# whole array pass on small networks.
+ROAD_INDEX_MIN_SEGMENTS = 1 << 12
+# (points x segments) elements projected per batch tile; small enough for the temporaries to
+# stay in cache.
+ROAD_BATCH_ELEMENTS = 1 << 14
+# Relative slack when collecting lines near the nearest one, so floating-point differences
+# between Shapely's distance and the projection below never drop the true nearest segment.
+_NEAREST_DISTANCE_SLACK = 1e-9
+# Bump when the layout of prepared road caches changes so stale files are ignored.
+_PREPARED_CACHE_VERSION = 1
+
 
 def _read_geo_dataframe(path: Path, **kwargs: object) -> gpd.GeoDataFrame:
     """Load a GeoDataFrame ensuring Arrow-backed IO when supported."""
@@ -47,6 +68,29 @@ class RoadNetwork:
         if not self._geometries:
             raise ValueError("RoadNetwork requires at least one geometry.")
         self.crs = crs
+        # Segments of every line are flattened into columns once so each access query is a
+        # single array pass instead of a Python loop over vertices.
+        coords, owners = shapely.get_coordinates(self._geometries, return_index=True)
+        within_line = owners[1:] == owners[:-1]
+        starts = coords[:-1][within_line]
+        ends = coords[1:][within_line]
+        # Segments of line ``i`` occupy [_line_offsets[i], _line_offsets[i + 1]).
+        self._line_offsets = np.searchsorted(
+            owners[:-1][within_line],
+            np.arange(len(self._geometries) + 1),
+        )
+        self._segment_x: NDArray[np.float64] = np.ascontiguousarray(starts[:, 0])
+        self._segment_y: NDArray[np.float64] = np.ascontiguousarray(starts[:, 1])
+        self._segment_dx: NDArray[np.float64] = ends[:, 0] - starts[:, 0]
+        self._segment_dy: NDArray[np.float64] = ends[:, 1] - starts[:, 1]
+        self._segment_length_sq: NDArray[np.float64] = (
+            self._segment_dx * self._segment_dx + self._segment_dy * self._segment_dy
+        )
+
+    @cached_property
+    def _tree(self) -> shapely.STRtree:
+        """Build the line index on first use; small networks are scanned without one."""
+        return shapely.STRtree(self._geometries)
 
     @property
     def geometries(self) -> list[LineString]:
@@ -54,30 +98,27 @@ class RoadNetwork:
         return list(self._geometries)
 
     @classmethod
-    def from_geojson(cls, path: Path, target_crs: str) -> RoadNetwork:
-        """Load road geometries from GeoJSON and reproject to target CRS."""
-        gdf = _read_geo_dataframe(path)
-        if gdf.empty:
-            raise ValueError(f"GeoJSON at {path} contains no features.")
-        inferred_projected = _looks_projected(gdf)
-        if gdf.crs is None:
-            if inferred_projected:
-                gdf = gdf.set_crs(target_crs, allow_override=True)
-            else:
-                gdf = gdf.set_crs("EPSG:4326", allow_override=True).to_crs(target_crs)
-        else:
-            crs_epsg = gdf.crs.to_epsg()
-            if inferred_projected and crs_epsg in {4326, 4979}:
-                gdf = gdf.set_crs(target_crs, allow_override=True)
-            else:
-                gdf = gdf.to_crs(target_crs)
-        lines: list[LineString] = []
-        for geom in gdf.geometry:
-            if isinstance(geom, LineString):
-                lines.append(geom)
-            elif isinstance(geom, MultiLineString):
-                lines.extend(segment for segment in geom.geoms if isinstance(segment, LineString))
-        return cls(lines, crs=target_crs)
+    def from_geojson(
+        cls,
+        path: Path,
+        target_crs: str,
+        cache_dir: Path | None = None,
+    ) -> RoadNetwork:
+        """
+        Load road geometries from GeoJSON and reproject to target CRS.
+
+        With ``cache_dir``, the reprojected vertices are kept there (one file per source and
+        ``target_crs``), so later loads of an unchanged file skip parsing and reprojection.
+        """
+        entry = _prepared_cache_entry(path, target_crs, cache_dir) if cache_dir else None
+        if entry is not None:
+            cached = _load_prepared_lines(*entry)
+            if cached is not None:
+                return cls(cached, crs=target_crs)
+        network = cls(_read_lines(path, target_crs), crs=target_crs)
+        if entry is not None:
+            _save_prepared_lines(*entry, network._geometries)
+        return network
 
     @classmethod
     def synthetic(cls, target_crs: str = "EPSG:32610") -> RoadNetwork:
@@ -96,46 +137,99 @@ class RoadNetwork:
         walking_speed_kmh: float,
     ) -> RoadAccessPoint:
         """Find the shortest straight-line walk from a point to the road network."""
+        return self.nearest_access_points([point_xy], walking_speed_kmh)[0]
+
+    def nearest_access_points(
+        self,
+        points_xy: Sequence[tuple[float, float]] | NDArray[np.float64],
+        walking_speed_kmh: float,
+    ) -> list[RoadAccessPoint]:
+        """Find the nearest road access point for each of ``points_xy`` in one batch."""
         if walking_speed_kmh <= 0.0:
             raise ValueError("walking_speed_kmh must be positive")
-        target_x, target_y = point_xy
-        best_distance_sq = np.inf
-        best_coordinate: tuple[float, float] | None = None
-
-        for geom in self._geometries:
-            coords = np.asarray(geom.coords, dtype=np.float64)
-            if len(coords) < 2:
-                continue
-            segments_start = coords[:-1]
-            segments_end = coords[1:]
-            for start, end in zip(segments_start, segments_end, strict=False):
-                dx = end[0] - start[0]
-                dy = end[1] - start[1]
-                segment_length_sq = dx * dx + dy * dy
-                if segment_length_sq == 0.0:
-                    candidate_x, candidate_y = float(start[0]), float(start[1])
-                else:
-                    numerator = ((target_x - start[0]) * dx) + ((target_y - start[1]) * dy)
-                    t = numerator / segment_length_sq
-                    t = min(1.0, max(0.0, t))
-                    candidate_x = float(start[0] + t * dx)
-                    candidate_y = float(start[1] + t * dy)
-                diff_x = candidate_x - target_x
-                diff_y = candidate_y - target_y
-                distance_sq = diff_x * diff_x + diff_y * diff_y
-                if distance_sq < best_distance_sq:
-                    best_distance_sq = distance_sq
-                    best_coordinate = (candidate_x, candidate_y)
-
-        if best_coordinate is None:  # pragma: no cover - defensive
+        if not self._segment_length_sq.size:  # pragma: no cover - defensive
             raise RuntimeError("Failed to determine nearest road.")
+        points = np.asarray(points_xy, dtype=np.float64).reshape(-1, 2)
+        if self._segment_length_sq.size >= ROAD_INDEX_MIN_SEGMENTS:
+            # Only lines about as close as the nearest one can hold the nearest segment.
+            found = [
+                self._nearest_on_segments(points[index : index + 1], self._segments_near(x, y))
+                for index, (x, y) in enumerate(points.tolist())
+            ]
+        else:
+            # Points are projected onto every segment a tile at a time, bounding the
+            # (points x segments) temporaries.
+            rows = max(1, ROAD_BATCH_ELEMENTS // self._segment_length_sq.size)
+            found = [
+                self._nearest_on_segments(points[start : start + rows], None)
+                for start in range(0, points.shape[0], rows)
+            ]
+        if not found:
+            return []
+        xs = np.concatenate([x for x, _, _ in found])
+        ys = np.concatenate([y for _, y, _ in found])
+        distances = np.sqrt(np.concatenate([distance_sq for _, _, distance_sq in found]))
+        walking_minutes = distances / 1000.0 / walking_speed_kmh * 60.0
+        return [
+            RoadAccessPoint(coordinate=(x, y), distance_m=distance, walking_minutes=minutes)
+            for x, y, distance, minutes in zip(
+                xs.tolist(),
+                ys.tolist(),
+                distances.tolist(),
+                walking_minutes.tolist(),
+                strict=True,
+            )
+        ]
+
+    def _nearest_on_segments(
+        self,
+        points: NDArray[np.float64],
+        selection: NDArray[np.intp] | None,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Return x, y of the closest point on the selected segments and its squared distance."""
+        segment_x = self._segment_x
+        segment_y = self._segment_y
+        segment_dx = self._segment_dx
+        segment_dy = self._segment_dy
+        segment_length_sq = self._segment_length_sq
+        if selection is not None:
+            segment_x = segment_x[selection]
+            segment_y = segment_y[selection]
+            segment_dx = segment_dx[selection]
+            segment_dy = segment_dy[selection]
+            segment_length_sq = segment_length_sq[selection]
+        target_x = points[:, 0:1]
+        target_y = points[:, 1:2]
+        numerator = (target_x - segment_x) * segment_dx
+        numerator += (target_y - segment_y) * segment_dy
+        # Zero-length segments keep t = 0 and so resolve to their start vertex.
+        t = np.divide(
+            numerator,
+            segment_length_sq,
+            out=np.zeros_like(numerator),
+            where=segment_length_sq != 0.0,
+        )
+        np.clip(t, 0.0, 1.0, out=t)
+        candidate_x = segment_x + t * segment_dx
+        candidate_y = segment_y + t * segment_dy
+        diff_x = candidate_x - target_x
+        diff_y = candidate_y - target_y
+        distance_sq = diff_x * diff_x + diff_y * diff_y
+        rows = np.arange(points.shape[0])
+        best = np.argmin(distance_sq, axis=1)
+        return candidate_x[rows, best], candidate_y[rows, best], distance_sq[rows, best]
 
-        best_distance = float(np.sqrt(best_distance_sq))
-        walking_minutes = (best_distance / 1000.0) / walking_speed_kmh * 60.0
-        return RoadAccessPoint(
-            coordinate=best_coordinate,
-            distance_m=best_distance,
-            walking_minutes=walking_minutes,
+    def _segments_near(self, target_x: float, target_y: float) -> NDArray[np.intp]:
+        """Return, in network order, the segments of lines within the nearest-line distance."""
+        point = shapely.Point(target_x, target_y)
+        _, distances = self._tree.query_nearest(point, return_distance=True)
+        reach = float(distances[0]) * (1.0 + _NEAREST_DISTANCE_SLACK) + _NEAREST_DISTANCE_SLACK
+        lines = np.sort(self._tree.query(point, predicate="dwithin", distance=reach))
+        return np.concatenate(
+            [
+                np.arange(self._line_offsets[line], self._line_offsets[line + 1])
+                for line in lines.tolist()
+            ],
         )
 
 
@@ -153,11 +247,95 @@ def estimate_driving_time_minutes(
         raise ValueError("driving_speed_kmh must be positive")
     dx = observer_xy[0] - road_point_xy[0]
     dy = observer_xy[1] - road_point_xy[1]
-    straight_distance_m = float(np.hypot(dx, dy))
+    straight_distance_m = math.hypot(dx, dy)
     adjusted_distance_km = straight_distance_m / 1000.0 * 1.35
     return (adjusted_distance_km / driving_speed_kmh) * 60.0
 
 
+def _read_lines(path: Path, target_crs: str) -> list[LineString]:
+    """Read the line geometries of a road GeoJSON reprojected to ``target_crs``."""
+    # Only geometries are used, so attribute columns (OSM tags) are not decoded at all.
+    # ``columns`` is a pyogrio option; fiona, geopandas' default when installed, rejects it.
+    gdf = _read_geo_dataframe(path, engine="pyogrio", columns=[])
+    if gdf.empty:
+        raise ValueError(f"GeoJSON at {path} contains no features.")
+    inferred_projected = _looks_projected(gdf)
+    if gdf.crs is None:
+        if inferred_projected:
+            gdf = gdf.set_crs(target_crs, allow_override=True)
+        else:
+            gdf = gdf.set_crs("EPSG:4326", allow_override=True).to_crs(target_crs)
+    else:
+        crs_epsg = gdf.crs.to_epsg()
+        if inferred_projected and crs_epsg in {4326, 4979}:
+            gdf = gdf.set_crs(target_crs, allow_override=True)
+        else:
+            gdf = gdf.to_crs(target_crs)
+    lines: list[LineString] = []
+    for geom in gdf.geometry:
+        if isinstance(geom, LineString):
+            lines.append(geom)
+        elif isinstance(geom, MultiLineString):
+            lines.extend(segment for segment in geom.geoms if isinstance(segment, LineString))
+    return lines
+
+
+def _prepared_cache_entry(
+    path: Path,
+    target_crs: str,
+    cache_dir: Path,
+) -> tuple[Path, NDArray[np.int64]] | None:
+    """
+    Return the prepared-cache file for ``path`` and the stamp its contents must carry.
+
+    The file name depends only on the source path and ``target_crs``, so an edited or
+    re-downloaded source overwrites its previous cache instead of adding another one. The
+    stamp (format version, size, and mtime) is stored inside the file to detect staleness.
+    ``None`` means the source cannot be stat'ed.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    digest = hashlib.sha256(f"{path.resolve()}:{target_crs}".encode()).hexdigest()[:16]
+    stamp = np.array([_PREPARED_CACHE_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    return cache_dir / f"roads-{digest}.npz", stamp
+
+
+def _load_prepared_lines(path: Path, stamp: NDArray[np.int64]) -> list[LineString] | None:
+    """Rebuild lines from a prepared cache; missing, stale, or unreadable caches yield ``None``."""
+    try:
+        with np.load(path) as prepared:
+            if not np.array_equal(prepared["stamp"], stamp):
+                return None
+            coords = prepared["coords"]
+            owners = prepared["owners"]
+        if not len(owners):
+            return None
+        lines = shapely.linestrings(coords, indices=owners)
+    except (OSError, ValueError, KeyError, shapely.errors.GEOSException):
+        return None
+    return list(lines)
+
+
+def _save_prepared_lines(
+    path: Path,
+    stamp: NDArray[np.int64],
+    lines: Sequence[LineString],
+) -> None:
+    """Atomically write the vertices of ``lines`` so later loads can skip the GeoJSON."""
+    coords, owners = shapely.get_coordinates(lines, return_index=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.part")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temporary.open("wb") as handle:
+            np.savez(handle, stamp=stamp, coords=coords, owners=owners)
+        temporary.replace(path)
+    except OSError as exc:
+        LOG.debug("Could not persist prepared roads %s (%s)", path, exc)
+        temporary.unlink(missing_ok=True)
+
+
 def _looks_projected(gdf: gpd.GeoDataFrame) -> bool:
     minx, miny, maxx, maxy = gdf.total_bounds
     return any(abs(value) > 360 for value in (minx, miny, maxx, maxy))
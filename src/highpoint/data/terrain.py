@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import math
+import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import rasterio
@@ -11,6 +15,10 @@ from numpy.typing import NDArray
 from rasterio.enums import Resampling
 from rasterio.transform import Affine, array_bounds
 
+# GDAL's warper splits the destination into chunks of at most this size and spreads them over
+# worker threads; the default 64 MB forces many small chunks for a regional DEM.
+WARP_MEMORY_LIMIT_MB = 512
+
 
 def _slice_from_bounds(
     bounds: tuple[float, float, float, float],
@@ -26,17 +34,19 @@ def _slice_from_bounds(
     """
     left, bottom, right, top = bounds
     inv = ~transform
-    cols = []
-    rows = []
-    for x, y in ((left, bottom), (left, top), (right, bottom), (right, top)):
-        col, row = inv * (x, y)
-        cols.append(col)
-        rows.append(row)
-
-    col_start = max(0, int(np.floor(min(cols))))
-    col_stop = min(width, int(np.ceil(max(cols))))
-    row_start = max(0, int(np.floor(min(rows))))
-    row_stop = min(height, int(np.ceil(max(rows))))
+    # The inverse is affine, so the extremes over the four corners come from the extremes of
+    # each term; this avoids four ``Affine.__mul__`` dispatches per call.
+    col_terms = (inv.a * left, inv.a * right), (inv.b * bottom, inv.b * top)
+    row_terms = (inv.d * left, inv.d * right), (inv.e * bottom, inv.e * top)
+    col_min = min(col_terms[0]) + min(col_terms[1]) + inv.c
+    col_max = max(col_terms[0]) + max(col_terms[1]) + inv.c
+    row_min = min(row_terms[0]) + min(row_terms[1]) + inv.f
+    row_max = max(row_terms[0]) + max(row_terms[1]) + inv.f
+
+    col_start = max(0, math.floor(col_min))
+    col_stop = min(width, math.ceil(col_max))
+    row_start = max(0, math.floor(row_min))
+    row_stop = min(height, math.ceil(row_max))
 
     if col_start >= col_stop or row_start >= row_stop:
         return None
@@ -47,7 +57,7 @@ def _slice_from_bounds(
 class TerrainGrid:
     """Represents a DEM subset in a projected coordinate system."""
 
-    elevations: NDArray[np.float32]
+    elevations: NDArray[np.floating[Any]]
     transform: Affine
     crs: str
 
@@ -67,13 +77,55 @@ class TerrainGrid:
     def width(self) -> int:
         return int(self.elevations.shape[1])
 
+    @cached_property
+    def contiguous_elevations(self) -> NDArray[np.floating[Any]]:
+        """
+        Return the elevations as a C-contiguous floating-point array, copying at most once.
+
+        The hot terrain kernels stream the whole raster, so they read a packed layout. Float
+        grids keep their precision (the loaders produce float32); other dtypes are converted
+        to float32. Grids that are already packed are returned as-is, and clipped views are
+        copied once and reused.
+        """
+        if np.issubdtype(self.elevations.dtype, np.floating):
+            return np.ascontiguousarray(self.elevations)
+        return np.ascontiguousarray(self.elevations, dtype=np.float32)
+
+    @cached_property
+    def max_elevation(self) -> float:
+        """Return the highest finite elevation, or ``-inf`` when every cell is nodata."""
+        if not self.elevations.size:
+            return -math.inf
+        return float(np.fmax.reduce(self.elevations, axis=None, initial=-math.inf))
+
     def coordinates(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
-        """Return meshgrid arrays of x, y projected coordinates at cell centers."""
-        rows = np.arange(self.height, dtype=np.float64)
-        cols = np.arange(self.width, dtype=np.float64)
-        col_grid, row_grid = np.meshgrid(cols, rows)
-        col_centers = col_grid + 0.5
-        row_centers = row_grid + 0.5
+        """Return read-only ``(height, width)`` x, y projected coordinates at cell centers."""
+        return self._cell_center_grid
+
+    @cached_property
+    def _cell_center_grid(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        rows = np.arange(self.height, dtype=np.float64)[:, np.newaxis]
+        cols = np.arange(self.width, dtype=np.float64)[np.newaxis, :]
+        shape = (self.height, self.width)
+        if self.transform.b == 0.0 and self.transform.d == 0.0:
+            # North-up grids vary x only by column and y only by row, so both coordinate grids
+            # are broadcast views of a single axis instead of two full rasters.
+            xs = self.transform.c + (cols + 0.5) * self.transform.a
+            ys = self.transform.f + (rows + 0.5) * self.transform.e
+            return np.broadcast_to(xs, shape), np.broadcast_to(ys, shape)
+        xs, ys = self.cell_centers(rows, cols)
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        return xs, ys
+
+    def cell_centers(
+        self,
+        rows: NDArray[np.integer] | NDArray[np.floating],
+        cols: NDArray[np.integer] | NDArray[np.floating],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Return projected x, y coordinates of the given cell centers (broadcasting inputs)."""
+        col_centers = np.asarray(cols, dtype=np.float64) + 0.5
+        row_centers = np.asarray(rows, dtype=np.float64) + 0.5
         xs = self.transform.c + col_centers * self.transform.a + row_centers * self.transform.b
         ys = self.transform.f + col_centers * self.transform.d + row_centers * self.transform.e
         return xs, ys
@@ -109,7 +161,9 @@ class TerrainLoader:
         """
         if resolution_scale <= 0.0:
             raise ValueError("resolution_scale must be positive")
-        with rasterio.open(self.path) as dataset:
+        threads = os.cpu_count() or 1
+        # GDAL_NUM_THREADS lets the GeoTIFF driver decompress the blocks of a window in parallel.
+        with rasterio.Env(GDAL_NUM_THREADS=threads), rasterio.open(self.path) as dataset:
             transform = dataset.transform
             array: NDArray[np.float32]
 
@@ -187,7 +241,8 @@ class TerrainLoader:
                     src_nodata=np.nan,
                     resampling=WarpResampling.bilinear,
                     dst_nodata=np.nan,
-                    num_threads=1,
+                    num_threads=threads,
+                    warp_mem_limit=WARP_MEMORY_LIMIT_MB,
                 )
                 array = destination
                 out_transform = dest_transform
@@ -213,14 +268,14 @@ def generate_synthetic_dem(
     The grid uses an arbitrary 30 m resolution and EPSG:32610 projection.
     """
     rows, cols = size
-    y = np.linspace(0, 1, rows)
-    x = np.linspace(0, 1, cols)
-    xx, yy = np.meshgrid(x, y)
-    slope = base_height + 20 * yy
+    # Broadcast column/row axes instead of full meshgrids; only the result is grid-sized.
+    y = np.linspace(0, 1, rows)[:, np.newaxis]
+    x = np.linspace(0, 1, cols)[np.newaxis, :]
     # A compact rocky summit followed by a steep drop gives the toy visibility model
     # a genuine long-distance horizon instead of a rounded shoulder that hides the valley.
-    center = np.exp(-((xx - 0.5) ** 2 + (yy - 0.4) ** 2) * 5_000.0)
-    elevations = slope + center * (peak_height - base_height)
+    center = np.exp(-((x - 0.5) ** 2 + (y - 0.4) ** 2) * 5_000.0)
+    center *= peak_height - base_height
+    center += base_height + 20 * y
     width_m = cols * 30.0
     height_m = rows * 30.0
     transform = Affine.translation(
@@ -228,7 +283,7 @@ def generate_synthetic_dem(
         5_199_400.0 + height_m / 2.0,
     ) * Affine.scale(30, -30)
     return TerrainGrid(
-        elevations=elevations.astype(np.float32),
+        elevations=center.astype(np.float32),
         transform=transform,
         crs="EPSG:32610",
     )
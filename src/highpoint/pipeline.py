@@ -7,12 +7,13 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
+from numpy.typing import NDArray
 from pyproj import Transformer
 
 from highpoint.analysis.candidates import TerrainCandidate, cluster_candidates, identify_candidates
-from highpoint.analysis.drivability import DrivabilityResult, evaluate_candidate_drivability
-from highpoint.analysis.visibility import VisibilityMetrics, compute_visibility_metrics
-from highpoint.config import AppConfig
+from highpoint.analysis.drivability import DrivabilityResult, evaluate_candidates_drivability
+from highpoint.analysis.visibility import VisibilityMetrics, compute_visibility_metrics_batch
+from highpoint.config import AppConfig, data_root
 from highpoint.data.discovery import (
     DatasetNotFoundError,
     compute_search_bounds,
@@ -23,7 +24,8 @@ from highpoint.data.discovery import (
 from highpoint.data.roads import RoadNetwork
 from highpoint.data.terrain import TerrainGrid
 from highpoint.utils import (
-    great_circle_distance_m,
+    cached_transformer,
+    great_circle_distances_m,
     meters_to_miles,
     miles_to_meters,
     utm_epsg_for_latlon,
@@ -78,8 +80,9 @@ def run_pipeline(config: AppConfig) -> PipelineOutput:
     results: list[ViewpointResult] = []
     inv_transform = transformer_xy_to_ll
 
-    for candidate in clustered:
-        metrics = compute_visibility_metrics(terrain_grid, candidate, config)
+    all_metrics = compute_visibility_metrics_batch(terrain_grid, clustered, config)
+    visible: list[tuple[TerrainCandidate, VisibilityMetrics]] = []
+    for candidate, metrics in zip(clustered, all_metrics, strict=True):
         if not metrics.has_clear_drop:
             LOG.debug(
                 "Candidate at (%.3f, %.3f) rejected: terrain never clears obstruction belt",
@@ -96,40 +99,49 @@ def run_pipeline(config: AppConfig) -> PipelineOutput:
                 config.visibility.min_field_of_view_deg,
             )
             continue
-        drivability = evaluate_candidate_drivability(
-            candidate_xy=(candidate.x, candidate.y),
-            observer_xy=observer_xy,
-            road_network=road_network,
-            config=config,
-        )
+        visible.append((candidate, metrics))
+
+    all_drivability = evaluate_candidates_drivability(
+        candidates_xy=[(candidate.x, candidate.y) for candidate, _ in visible],
+        observer_xy=observer_xy,
+        road_network=road_network,
+        config=config,
+    )
+    drivable: list[tuple[TerrainCandidate, VisibilityMetrics, DrivabilityResult]] = []
+    for (candidate, metrics), drivability in zip(visible, all_drivability, strict=True):
         if drivability is None:
             LOG.debug("Candidate at (%f, %f) rejected due to drivability", candidate.x, candidate.y)
             continue
+        drivable.append((candidate, metrics, drivability))
 
-        candidate_lonlat = tuple(inv_transform.transform(candidate.x, candidate.y))
-        candidate_latlon = (candidate_lonlat[1], candidate_lonlat[0])
-        access_latlon = None
-        access_altitude = None
-        access_x, access_y = drivability.access_point.coordinate
-        access_lonlat = tuple(inv_transform.transform(access_x, access_y))
-        access_latlon = (access_lonlat[1], access_lonlat[0])
-        access_altitude = _sample_elevation(terrain_grid, access_x, access_y)
-
-        straight_line_m = great_circle_distance_m(
-            (config.observer.latitude, config.observer.longitude),
-            candidate_latlon,
-        )
+    # Project every surviving candidate and access point back to lat/lon in two PROJ calls.
+    candidate_lons, candidate_lats = inv_transform.transform(
+        np.array([candidate.x for candidate, _, _ in drivable], dtype=np.float64),
+        np.array([candidate.y for candidate, _, _ in drivable], dtype=np.float64),
+    )
+    access_xy = np.array(
+        [drivability.access_point.coordinate for _, _, drivability in drivable],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    access_lons, access_lats = inv_transform.transform(access_xy[:, 0], access_xy[:, 1])
+    access_altitudes = _sample_elevations(terrain_grid, access_xy[:, 0], access_xy[:, 1])
+    straight_line_m = great_circle_distances_m(
+        (config.observer.latitude, config.observer.longitude),
+        candidate_lats,
+        candidate_lons,
+    )
 
+    for index, (candidate, metrics, drivability) in enumerate(drivable):
         score = _score_candidate(candidate, metrics, drivability, config)
         results.append(
             ViewpointResult(
                 candidate=candidate,
                 visibility=metrics,
                 drivability=drivability,
-                candidate_latlon=candidate_latlon,
-                access_latlon=access_latlon,
-                access_altitude_m=access_altitude,
-                straight_line_miles=meters_to_miles(straight_line_m),
+                candidate_latlon=(float(candidate_lats[index]), float(candidate_lons[index])),
+                access_latlon=(float(access_lats[index]), float(access_lons[index])),
+                access_altitude_m=float(access_altitudes[index]),
+                straight_line_miles=meters_to_miles(float(straight_line_m[index])),
                 score=score,
             ),
         )
@@ -176,38 +188,35 @@ def _load_terrain(config: AppConfig) -> tuple[TerrainGrid, tuple[float, float],
         terrain_cfg.resolution_scale,
         utm_crs,
     )
-    observer_xy = Transformer.from_crs("EPSG:4326", grid.crs, always_xy=True).transform(
+    observer_xy = cached_transformer("EPSG:4326", grid.crs).transform(
         config.observer.longitude,
         config.observer.latitude,
     )
-    return (
-        grid,
-        (observer_xy[0], observer_xy[1]),
-        Transformer.from_crs(
-            grid.crs,
-            "EPSG:4326",
-            always_xy=True,
-        ),
-    )
+    return grid, (observer_xy[0], observer_xy[1]), cached_transformer(grid.crs, "EPSG:4326")
 
 
 def _load_roads(config: AppConfig, target_crs: str) -> RoadNetwork:
     roads_cfg = config.roads
-    if roads_cfg.data_path is None:
-        path, _ = discover_roads_path(
-            config.observer.latitude,
-            config.observer.longitude,
-            config.terrain.search_radius_km,
-            prefer_source=roads_cfg.source,
-        )
-    else:
+    if roads_cfg.data_path is not None:
         path = Path(roads_cfg.data_path)
         if not path.exists():
             raise DatasetNotFoundError(
                 "roads",
                 f"Configured roads file {path} does not exist. Provide a GeoJSON cache.",
             )
-    return RoadNetwork.from_geojson(path, target_crs=target_crs)
+        return RoadNetwork.from_geojson(path, target_crs=target_crs)
+    path, _ = discover_roads_path(
+        config.observer.latitude,
+        config.observer.longitude,
+        config.terrain.search_radius_km,
+        prefer_source=roads_cfg.source,
+    )
+    # Discovered caches are reused across runs, so their reprojected vertices are kept too.
+    return RoadNetwork.from_geojson(
+        path,
+        target_crs=target_crs,
+        cache_dir=data_root() / "index" / "roads",
+    )
 
 
 def _score_candidate(
@@ -230,11 +239,19 @@ def _score_candidate(
     )
 
 
-def _sample_elevation(grid: TerrainGrid, x: float, y: float) -> float:
+def _sample_elevations(
+    grid: TerrainGrid,
+    xs: NDArray[np.float64],
+    ys: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Return the elevation of the cell containing each point, or NaN outside the grid."""
     inv_transform = ~grid.transform
-    col, row = inv_transform * (x, y)
-    row_i = int(np.floor(row))
-    col_i = int(np.floor(col))
-    if 0 <= row_i < grid.height and 0 <= col_i < grid.width:
-        return float(grid.elevations[row_i, col_i])
-    return float("nan")
+    cols = np.floor(xs * inv_transform.a + ys * inv_transform.b + inv_transform.c)
+    rows = np.floor(xs * inv_transform.d + ys * inv_transform.e + inv_transform.f)
+    inside = (rows >= 0) & (rows < grid.height) & (cols >= 0) & (cols < grid.width)
+    elevations = np.full(xs.shape, np.nan, dtype=np.float64)
+    elevations[inside] = grid.elevations[
+        rows[inside].astype(np.intp),
+        cols[inside].astype(np.intp),
+    ]
+    return elevations
@@ -271,20 +271,18 @@ def _visibility_profile(
     config: AppConfig,
 ) -> tuple[str, str]:
     rays = result.visibility.ray_results
-    if not rays:
+    if not len(rays):
         return "", ""
     max_distance_m = config.terrain.max_visibility_km * 1000.0
-    angles = sorted(rays.keys())
     symbols: list[str] = []
-    for angle in angles:
-        distance = max(0.0, rays[angle])
+    for ray_distance in rays.tolist():
+        distance = max(0.0, ray_distance)
         ratio = 0.0 if max_distance_m == 0 else min(distance / max_distance_m, 1.0)
         symbols.append(_symbol_for_ratio(ratio))
     profile = "".join(symbols)
     markers = [" "] * len(profile)
     for label, target_angle in (("N", 0.0), ("E", 90.0), ("S", 180.0), ("W", 270.0)):
-        idx = _closest_angle_index(angles, target_angle)
-        markers[idx] = label
+        markers[_closest_ray_index(len(rays), target_angle)] = label
     return profile, "".join(markers)
 
 
@@ -300,9 +298,8 @@ def _symbol_for_ratio(ratio: float) -> str:
     return " "
 
 
-def _closest_angle_index(angles: list[float], target: float) -> int:
-    def angular_distance(candidate: float, goal: float) -> float:
-        diff = abs(candidate - goal) % 360.0
-        return min(diff, 360.0 - diff)
-
-    return min(range(len(angles)), key=lambda idx: angular_distance(angles[idx], target))
+def _closest_ray_index(ray_count: int, target: float) -> int:
+    """Return the index of the ray nearest ``target`` among ``ray_count`` evenly spaced rays."""
+    # Rays sit at i * 360 / ray_count, so the nearest one follows from the index arithmetic;
+    # exact ties go to the ray counter-clockwise of the target.
+    return math.ceil((target % 360.0) * ray_count / 360.0 - 0.5) % ray_count
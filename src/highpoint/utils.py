@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
-from pyproj import Geod
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pyproj import Geod, Transformer
 
 MILES_TO_METERS = 1609.344
 KILOMETERS_TO_MILES = 0.621371
@@ -30,6 +33,23 @@ def great_circle_distance_m(origin: tuple[float, float], dest: tuple[float, floa
     return float(distance)
 
 
+def great_circle_distances_m(
+    origin: tuple[float, float],
+    dest_lats: ArrayLike,
+    dest_lons: ArrayLike,
+) -> NDArray[np.float64]:
+    """Return great-circle distances in meters from ``origin`` to each lat/lon destination."""
+    lats = np.asarray(dest_lats, dtype=np.float64)
+    lons = np.asarray(dest_lons, dtype=np.float64)
+    _, _, distances = WGS84.inv(
+        np.full_like(lons, origin[1]),
+        np.full_like(lats, origin[0]),
+        lons,
+        lats,
+    )
+    return np.asarray(distances, dtype=np.float64)
+
+
 def utm_epsg_for_latlon(lat: float, lon: float) -> int:
     """Return EPSG code for the UTM zone covering the provided coordinate."""
     zone = min(60, max(1, int((lon + 180) / 6) + 1))
@@ -41,3 +61,14 @@ def unit_vector(azimuth_deg: float) -> tuple[float, float]:
     """Return unit vector in azimuth direction (degrees clockwise from north)."""
     radians = math.radians(azimuth_deg)
     return math.sin(radians), math.cos(radians)
+
+
+@lru_cache(maxsize=64)
+def cached_transformer(source_crs: str, target_crs: str) -> Transformer:
+    """
+    Return an ``always_xy`` transformer between two CRS definitions.
+
+    Building a transformer looks up the PROJ database and costs far more than transforming a
+    handful of points, so instances are shared per CRS pair.
+    """
+    return Transformer.from_crs(source_crs, target_crs, always_xy=True)
@@ -53,9 +53,9 @@ def test_cli_with_config_and_overrides__runs_pipeline_and_renderer(
 
     monkeypatch.setenv("DATA_ROOT", str(tmp_path / "data"))
     monkeypatch.setenv("OUT_DIR", str(tmp_path / "outputs"))
-    monkeypatch.setattr("highpoint.app.run_pipeline", fake_run)
-    monkeypatch.setattr("highpoint.app.emit_report", fake_report)
-    monkeypatch.setattr("highpoint.app.render_map", fake_render)
+    monkeypatch.setattr("highpoint.pipeline.run_pipeline", fake_run)
+    monkeypatch.setattr("highpoint.reporting.report.emit_report", fake_report)
+    monkeypatch.setattr("highpoint.render.map.render_map", fake_render)
 
     result = CliRunner().invoke(
         app,
@@ -92,8 +92,8 @@ def test_location__uses_gazetteer_coordinates(
         return SimpleNamespace(results=[], terrain=None)
 
     monkeypatch.setattr("highpoint.app.TownGazetteer", FakeGazetteer)
-    monkeypatch.setattr("highpoint.app.run_pipeline", fake_run)
-    monkeypatch.setattr("highpoint.app.emit_report", lambda *_: None)
+    monkeypatch.setattr("highpoint.pipeline.run_pipeline", fake_run)
+    monkeypatch.setattr("highpoint.reporting.report.emit_report", lambda *_: None)
 
     result = CliRunner().invoke(app, ["--location", "Example, WA"])
 
@@ -107,7 +107,7 @@ def test_dataset_error__returns_nonzero_exit(monkeypatch: pytest.MonkeyPatch) ->
     def fail(_config: AppConfig) -> Any:
         raise DatasetNotFoundError("terrain", "missing DEM")
 
-    monkeypatch.setattr("highpoint.app.run_pipeline", fail)
+    monkeypatch.setattr("highpoint.pipeline.run_pipeline", fail)
 
     result = CliRunner().invoke(
         app,
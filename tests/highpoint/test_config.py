@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
-from highpoint.config import VisibilityConfig, data_root, load_config
+from highpoint.config import (
+    AppConfig,
+    VisibilityConfig,
+    data_root,
+    load_config,
+    load_yaml_mapping,
+)
 
 
 def test_cli_values_override_yaml__explicit_values_win(
@@ -50,6 +57,51 @@ output:
     assert config.output.results_limit == 3
 
 
+def test_yaml_interpolation__resolves_after_cli_values_merge(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path / "data"))
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        """
+terrain:
+  max_visibility_km: ${output.results_limit}
+output:
+  results_limit: 20
+""".strip(),
+        encoding="utf-8",
+    )
+
+    config = load_config(
+        observer_lat=47.0,
+        observer_lon=-122.0,
+        observer_alt=0.0,
+        azimuth=180.0,
+        min_visibility_miles=1.0,
+        min_fov_deg=10.0,
+        results_limit=3,
+        config_path=config_path,
+    )
+
+    assert config.terrain.max_visibility_km == 3.0
+
+
+def test_load_yaml_mapping__reparses_only_after_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("observer:\n  latitude: 10.0\n", encoding="utf-8")
+
+    first = load_yaml_mapping(config_path)
+    first.observer.latitude = 99.0
+    assert load_yaml_mapping(config_path).observer.latitude == 10.0
+
+    config_path.write_text("observer:\n  latitude: 12.5\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_yaml_mapping(config_path).observer.latitude == 12.5
+
+
 def test_unknown_yaml_key__validation_fails(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -124,3 +176,12 @@ def test_unrepresentable_visibility_settings__validation_fails(
 ) -> None:
     with pytest.raises(ValidationError, match=message):
         VisibilityConfig.model_validate(values)
+
+
+def test_config_sections__are_frozen_and_share_defaults() -> None:
+    first = AppConfig.model_validate({"observer": {"latitude": 1.0, "longitude": 2.0}})
+    second = AppConfig.model_validate({"observer": {"latitude": 3.0, "longitude": 4.0}})
+
+    assert first.terrain is second.terrain
+    with pytest.raises(ValidationError, match="frozen"):
+        first.terrain.search_radius_km = 5.0
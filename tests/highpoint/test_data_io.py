@@ -9,6 +9,7 @@ from scripts.fetch_datasets import tiles_for_bbox
 from shapely.geometry import LineString
 
 from highpoint.config import load_config
+from highpoint.data import roads
 from highpoint.data.roads import RoadNetwork, estimate_driving_time_minutes
 from highpoint.data.terrain import TerrainLoader, generate_synthetic_dem, save_grid_to_geotiff
 from highpoint.pipeline import run_pipeline
@@ -63,6 +64,49 @@ def test_road_network_from_geojson__loads_lines(tmp_path: Path) -> None:
     assert 0.0 <= result.distance_m <= 200.0
 
 
+def test_road_network_from_geojson__reuses_prepared_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    geojson_path = tmp_path / "roads.geojson"
+    gdf = gpd.GeoDataFrame(
+        {"name": ["A", "B"]},
+        geometry=[
+            LineString([(-122.30, 47.60), (-122.29, 47.61), (-122.28, 47.61)]),
+            LineString([(-122.31, 47.59), (-122.31, 47.62)]),
+        ],
+        crs="EPSG:4326",
+    )
+    gdf.to_file(geojson_path, driver="GeoJSON")
+    cache_dir = tmp_path / "prepared"
+
+    first = RoadNetwork.from_geojson(geojson_path, target_crs="EPSG:32610", cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("roads-*.npz"))) == 1
+
+    def fail_read(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("prepared cache should skip reading the GeoJSON")
+
+    monkeypatch.setattr(roads, "_read_geo_dataframe", fail_read)
+    second = RoadNetwork.from_geojson(geojson_path, target_crs="EPSG:32610", cache_dir=cache_dir)
+
+    assert [line.wkb for line in second.geometries] == [line.wkb for line in first.geometries]
+
+
+def test_road_network_from_geojson__replaces_stale_prepared_cache(tmp_path: Path) -> None:
+    geojson_path = tmp_path / "roads.geojson"
+    cache_dir = tmp_path / "prepared"
+    line = LineString([(-122.30, 47.60), (-122.29, 47.61)])
+    gpd.GeoDataFrame(geometry=[line], crs="EPSG:4326").to_file(geojson_path, driver="GeoJSON")
+    RoadNetwork.from_geojson(geojson_path, target_crs="EPSG:32610", cache_dir=cache_dir)
+
+    edited = [line, LineString([(-122.31, 47.59), (-122.31, 47.62)])]
+    gpd.GeoDataFrame(geometry=edited, crs="EPSG:4326").to_file(geojson_path, driver="GeoJSON")
+    network = RoadNetwork.from_geojson(geojson_path, target_crs="EPSG:32610", cache_dir=cache_dir)
+
+    assert len(network.geometries) == 2
+    assert len(list(cache_dir.iterdir())) == 1
+
+
 def test_nonpositive_travel_speed__raises() -> None:
     network = RoadNetwork.synthetic()
 
@@ -72,6 +116,47 @@ def test_nonpositive_travel_speed__raises() -> None:
         estimate_driving_time_minutes((0.0, 0.0), (1.0, 1.0), driving_speed_kmh=0.0)
 
 
+def test_nearest_access_point__spatial_index_matches_full_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rng = np.random.default_rng(7)
+    lines = [
+        LineString(rng.uniform(0.0, 5_000.0, 2) + np.cumsum(rng.normal(0.0, 80.0, (5, 2)), axis=0))
+        for _ in range(200)
+    ]
+    network = RoadNetwork(lines, crs="EPSG:32610")
+    queries = [tuple(point) for point in rng.uniform(-500.0, 5_500.0, (50, 2))]
+
+    monkeypatch.setattr(roads, "ROAD_INDEX_MIN_SEGMENTS", 1 << 30)
+    full_scan = [network.nearest_access_point(query, walking_speed_kmh=5.0) for query in queries]
+    monkeypatch.setattr(roads, "ROAD_INDEX_MIN_SEGMENTS", 0)
+    indexed = [network.nearest_access_point(query, walking_speed_kmh=5.0) for query in queries]
+
+    assert indexed == full_scan
+
+
+def test_small_network__does_not_build_spatial_index() -> None:
+    network = RoadNetwork.synthetic()
+
+    network.nearest_access_point((500_000.0, 5_200_000.0), walking_speed_kmh=5.0)
+
+    assert "_tree" not in vars(network)
+
+
+def test_nearest_access_points__batch_matches_single_queries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    network = RoadNetwork.synthetic()
+    points = [(500_000.0 + 150.0 * step, 5_199_000.0 + 110.0 * step) for step in range(20)]
+    singles = [network.nearest_access_point(point, walking_speed_kmh=4.0) for point in points]
+
+    # A tiny budget forces several tiles.
+    monkeypatch.setattr(roads, "ROAD_BATCH_ELEMENTS", 8)
+
+    assert network.nearest_access_points(points, walking_speed_kmh=4.0) == singles
+    assert network.nearest_access_points([], walking_speed_kmh=4.0) == []
+
+
 def test_load_config_with_file_and_overrides(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
+from rasterio.warp import transform_bounds
 
+from highpoint.data import discovery
 from highpoint.data.discovery import (
     DatasetNotFoundError,
+    RoadAsset,
+    TerrainAsset,
+    _AssetCatalog,
+    _bounds_to_latlon,
     discover_roads_path,
     discover_terrain_paths,
     load_terrain_grid,
@@ -60,3 +67,106 @@ def test_load_terrain_grid_with_invalid_scale__raises() -> None:
             0.0,
             "EPSG:32610",
         )
+
+
+def test_asset_catalog__returns_overlapping_assets_in_scan_order() -> None:
+    assets = [
+        TerrainAsset(path=Path("east.tif"), bounds=(46.0, 47.0, -122.0, -121.0)),
+        TerrainAsset(path=Path("touching.tif"), bounds=(47.0, 48.0, -123.0, -122.0)),
+        TerrainAsset(path=Path("west.tif"), bounds=(46.0, 47.0, -123.0, -122.0)),
+        TerrainAsset(path=Path("far.tif"), bounds=(10.0, 11.0, 10.0, 11.0)),
+    ]
+    catalog = _AssetCatalog.build(assets)
+
+    found = catalog.intersecting((46.5, 47.0, -122.5, -121.5))
+
+    assert [asset.path.name for asset in found] == ["east.tif", "west.tif"]
+    assert _AssetCatalog.build([]).intersecting((0.0, 1.0, 0.0, 1.0)) == []
+
+
+def test_asset_catalog__best_covering_prefers_largest_overlap() -> None:
+    assets = [
+        RoadAsset(path=Path("sliver.geojson"), bounds=(46.0, 47.0, -122.1, -121.9)),
+        RoadAsset(path=Path("half.geojson"), bounds=(46.0, 47.0, -123.0, -122.0)),
+        RoadAsset(path=Path("also_half.geojson"), bounds=(46.0, 47.0, -122.0, -121.0)),
+    ]
+    catalog = _AssetCatalog.build(assets)
+
+    best = catalog.best_covering((46.0, 47.0, -122.5, -121.5))
+
+    assert best is not None and best.path.name == "half.geojson"
+    assert catalog.best_covering((10.0, 11.0, 10.0, 11.0)) is None
+
+
+def test_terrain_scan__reuses_bounds_index_across_processes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path))
+    discovery._terrain_entries.cache_clear()
+    first, _ = discover_terrain_paths(46.9480, -122.9920, radius_km=2.0)
+    assert (tmp_path / "highpoint" / "index" / "terrain_bounds.json").is_file()
+
+    def fail_probe(path: Path) -> tuple[float, float, float, float]:
+        raise AssertionError(f"{path} should be answered from the index")
+
+    # A fresh process starts with an empty in-memory cache.
+    discovery._terrain_entries.cache_clear()
+    monkeypatch.setattr(discovery, "_raster_bounds_latlon", fail_probe)
+    second, _ = discover_terrain_paths(46.9480, -122.9920, radius_km=2.0)
+    discovery._terrain_entries.cache_clear()
+
+    assert second == first
+
+
+def test_bounds_to_latlon__matches_rasterio_transform_bounds() -> None:
+    projected = (500000.0, 5190000.0, 512000.0, 5204000.0)
+    west, south, east, north = transform_bounds(
+        "EPSG:32610",
+        "EPSG:4326",
+        *projected,
+        densify_pts=21,
+    )
+    lat_min, lat_max, lon_min, lon_max = _bounds_to_latlon("EPSG:32610", projected)
+    assert (lat_min, lat_max, lon_min, lon_max) == pytest.approx((south, north, west, east))
+
+
+def test_road_scan__places_unreferenced_files_in_each_query_zone(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path))
+    roads_dir = tmp_path / "roads"
+    roads_dir.mkdir()
+    (roads_dir / "projected.geojson").write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "properties": {},
+                        "geometry": {
+                            "type": "LineString",
+                            "coordinates": [[480000.0, 5180000.0], [520000.0, 5220000.0]],
+                        },
+                    },
+                ],
+            },
+        ),
+        encoding="utf-8",
+    )
+    discovery._road_scan.cache_clear()
+    discovery._road_entries.cache_clear()
+    path, _ = discover_roads_path(46.9, -123.0, radius_km=1.0, search_dirs=[roads_dir])
+
+    def fail_probe(path: Path) -> tuple[float, float, float, float]:
+        raise AssertionError(f"{path} should not be probed again")
+
+    monkeypatch.setattr(discovery, "_vector_bounds", fail_probe)
+    # The same native coordinates read as UTM zone 11 land six degrees further east.
+    shifted, _ = discover_roads_path(46.9, -117.0, radius_km=1.0, search_dirs=[roads_dir])
+    discovery._road_scan.cache_clear()
+    discovery._road_entries.cache_clear()
+
+    assert path == shifted == roads_dir / "projected.geojson"
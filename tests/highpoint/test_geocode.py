@@ -53,3 +53,19 @@ def test_gazetteer_not_found(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
     with pytest.raises(TownNotFoundError) as excinfo:
         gazetteer.resolve("Atlantis, WA")
     assert "Atlantis" in str(excinfo.value)
+
+
+def test_gazetteer_suggests_prefix_matches_in_state(tmp_path: Path) -> None:
+    dataset = tmp_path / "places.csv"
+    dataset.write_text(
+        "feature_id,name,state,latitude,longitude,elevation_m\n"
+        "1,Port Townsend,WA,48.1170,-122.7604,\n"
+        "2,Port Angeles,WA,48.1181,-123.4307,\n"
+        "3,Portland,OR,45.5152,-122.6784,\n"
+        "4,Poulsbo,WA,47.7359,-122.6465,\n",
+        encoding="utf-8",
+    )
+    gazetteer = TownGazetteer(dataset_path=dataset)
+    with pytest.raises(TownNotFoundError) as excinfo:
+        gazetteer.resolve("Port, WA")
+    assert excinfo.value.suggestions == ["Port Angeles, WA", "Port Townsend, WA"]
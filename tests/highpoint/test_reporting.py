@@ -28,7 +28,7 @@ def _result() -> ViewpointResult:
             mean_distance_m=1_500.0,
             median_distance_m=1_400.0,
             actual_fov_deg=45.0,
-            ray_results={0.0: 2_000.0},
+            ray_results=np.array([2_000.0]),
             rays_with_clearance=1,
             total_rays=1,
         ),
@@ -7,9 +7,14 @@ import pytest
 import rasterio
 from affine import Affine
 
-from highpoint.analysis.candidates import identify_candidates
+from highpoint.analysis.candidates import (
+    TerrainCandidate,
+    TerrainCandidateArray,
+    cluster_candidates,
+    identify_candidates,
+)
 from highpoint.data.terrain import TerrainGrid, TerrainLoader
-from highpoint.pipeline import _sample_elevation
+from highpoint.pipeline import _sample_elevations
 from highpoint.utils import utm_epsg_for_latlon
 
 
@@ -29,6 +34,49 @@ def test_rotated_grid_coordinates__apply_full_affine_transform() -> None:
     assert grid.resolution == pytest.approx((np.hypot(10.0, 3.0), np.hypot(2.0, -20.0)))
 
 
+def test_north_up_grid_coordinates__are_cached_read_only_views() -> None:
+    grid = TerrainGrid(
+        elevations=np.zeros((3, 4), dtype=np.float32),
+        transform=Affine(30.0, 0.0, 500_000.0, 0.0, -30.0, 5_200_000.0),
+        crs="EPSG:32610",
+    )
+
+    xs, ys = grid.coordinates()
+    expected_x, expected_y = grid.cell_centers(np.arange(3)[:, np.newaxis], np.arange(4))
+
+    assert grid.coordinates()[0] is xs
+    assert np.array_equal(xs, expected_x) and np.array_equal(ys, expected_y)
+    assert not xs.flags.writeable and not ys.flags.writeable
+
+
+def test_contiguous_elevations__keeps_float64_precision() -> None:
+    transform = Affine(10.0, 0.0, 0.0, 0.0, -10.0, 0.0)
+    elevations = np.arange(24, dtype=np.float64).reshape(4, 6) + 0.123456789
+    grid = TerrainGrid(elevations=elevations[:, ::2], transform=transform, crs="EPSG:32610")
+    integers = TerrainGrid(
+        elevations=np.ones((2, 2), dtype=np.int16),
+        transform=transform,
+        crs="EPSG:32610",
+    )
+
+    packed = grid.contiguous_elevations
+
+    assert packed.dtype == np.float64 and packed.flags.c_contiguous
+    assert np.array_equal(packed, elevations[:, ::2])
+    assert integers.contiguous_elevations.dtype == np.float32
+
+
+def test_max_elevation__ignores_nodata_cells() -> None:
+    transform = Affine(10.0, 0.0, 0.0, 0.0, -10.0, 0.0)
+    elevations = np.array([[np.nan, 12.5], [3.0, np.nan]], dtype=np.float32)
+
+    grid = TerrainGrid(elevations=elevations, transform=transform, crs="EPSG:32610")
+    empty = TerrainGrid(elevations=np.full((2, 2), np.nan), transform=transform, crs="EPSG:32610")
+
+    assert grid.max_elevation == 12.5
+    assert empty.max_elevation == -np.inf
+
+
 def test_terrain_loader_nodata__normalizes_to_nan(tmp_path: Path) -> None:
     dataset_path = tmp_path / "nodata.tif"
     data = np.array([[10.0, -9999.0], [20.0, 30.0]], dtype=np.float32)
@@ -88,13 +136,51 @@ def test_symmetric_peak__is_retained_by_neighborhood_slope() -> None:
     assert any(candidate.row == 10 and candidate.col == 10 for candidate in candidates)
 
 
+def test_peak_without_finite_slope__is_not_rejected_by_slope_filter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    coordinates = np.arange(21, dtype=np.float64) - 10.0
+    xx, yy = np.meshgrid(coordinates, coordinates)
+    elevations = 100.0 + 80.0 * np.exp(-((xx**2 + yy**2) / 18.0))
+    grid = TerrainGrid(
+        elevations=elevations.astype(np.float32),
+        transform=Affine.translation(0.0, 420.0) * Affine.scale(20.0, -20.0),
+        crs="EPSG:32610",
+    )
+
+    def nan_gradient(values: np.ndarray, *_spacing: float) -> list[np.ndarray]:
+        return [np.full_like(values, np.nan), np.full_like(values, np.nan)]
+
+    monkeypatch.setattr(np, "gradient", nan_gradient)
+    candidates = identify_candidates(grid, min_prominence_m=1.0, min_slope_deg=1.0)
+
+    assert any(candidate.row == 10 and candidate.col == 10 for candidate in candidates)
+
+
+def test_cluster_candidates__keeps_highest_candidate_per_bin() -> None:
+    candidates = [
+        TerrainCandidate(x=10.0, y=10.0, elevation_m=100.0, row=0, col=0),
+        TerrainCandidate(x=510.0, y=10.0, elevation_m=90.0, row=0, col=5),
+        TerrainCandidate(x=20.0, y=30.0, elevation_m=120.0, row=1, col=0),
+        TerrainCandidate(x=-10.0, y=10.0, elevation_m=150.0, row=0, col=-1),
+    ]
+
+    clustered = cluster_candidates(candidates, grid_size_m=250.0)
+
+    assert isinstance(clustered, TerrainCandidateArray)
+    assert list(clustered) == [candidates[2], candidates[1], candidates[3]]
+
+
 def test_sample_elevation_at_cell_center__uses_containing_cell() -> None:
     elevations = np.arange(9, dtype=np.float32).reshape(3, 3)
     transform = Affine.translation(100.0, 300.0) * Affine.scale(10.0, -10.0)
     grid = TerrainGrid(elevations=elevations, transform=transform, crs="EPSG:32610")
     x, y = transform * (1.5, 1.5)
 
-    assert _sample_elevation(grid, x, y) == 4.0
+    sampled = _sample_elevations(grid, np.array([x, 95.0]), np.array([y, 305.0]))
+
+    assert sampled[0] == 4.0
+    assert np.isnan(sampled[1])
 
 
 @pytest.mark.parametrize(("longitude", "expected"), [(-180.0, 32601), (180.0, 32660)])
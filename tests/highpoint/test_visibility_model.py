@@ -8,10 +8,16 @@ from typing import Any
 import numpy as np
 import pytest
 from affine import Affine
+from scipy.ndimage import map_coordinates
 
 from highpoint.analysis.candidates import TerrainCandidate
 from highpoint.analysis.drivability import DrivabilityResult
-from highpoint.analysis.visibility import VisibilityMetrics, compute_visibility_metrics
+from highpoint.analysis.visibility import (
+    VisibilityMetrics,
+    _bilinear,
+    compute_visibility_metrics,
+    compute_visibility_metrics_batch,
+)
 from highpoint.config import AppConfig
 from highpoint.data.roads import RoadAccessPoint, RoadNetwork
 from highpoint.data.terrain import TerrainGrid
@@ -99,8 +105,8 @@ def test_pipeline_discards_candidate_without_clearance(
     monkeypatch.setattr("highpoint.pipeline.identify_candidates", lambda g: [candidate])
     monkeypatch.setattr("highpoint.pipeline.cluster_candidates", lambda cands, _: list(cands))
     monkeypatch.setattr(
-        "highpoint.pipeline.evaluate_candidate_drivability",
-        lambda **_: drivability,
+        "highpoint.pipeline.evaluate_candidates_drivability",
+        lambda **kwargs: [drivability] * len(kwargs["candidates_xy"]),
     )
 
     output: PipelineOutput = run_pipeline(base_config)
@@ -117,6 +123,69 @@ def test_visibility_drop_met__extends_view_distance(base_config: AppConfig) -> N
     assert metrics.max_distance_m > base_config.visibility.obstruction_start_m
 
 
+def test_parallel_ray_blocks__match_serial_trace(
+    monkeypatch: pytest.MonkeyPatch,
+    base_config: AppConfig,
+) -> None:
+    grid, candidate = _make_grid(drop_after_columns=1, drop_amount=120.0)
+    config = base_config.model_copy(
+        update={"visibility": base_config.visibility.model_copy(update={"rays_full_circle": 72})},
+    )
+    monkeypatch.setattr("highpoint.analysis.visibility._ray_workers", lambda: 1)
+    serial = compute_visibility_metrics(grid, candidate, config)
+
+    monkeypatch.setattr("highpoint.analysis.visibility._ray_workers", lambda: 4)
+    parallel = compute_visibility_metrics(grid, candidate, config)
+
+    np.testing.assert_array_equal(parallel.ray_results, serial.ray_results)
+    assert parallel.rays_with_clearance == serial.rays_with_clearance
+    assert parallel.actual_fov_deg == serial.actual_fov_deg
+    assert parallel.rays_with_clearance > 0
+
+
+def test_batch_metrics__match_single_candidate_metrics(
+    monkeypatch: pytest.MonkeyPatch,
+    base_config: AppConfig,
+) -> None:
+    grid, center = _make_grid(drop_after_columns=1, drop_amount=120.0)
+    xs, ys = grid.coordinates()
+    candidates = [center] + [
+        TerrainCandidate(
+            x=float(xs[row, col]),
+            y=float(ys[row, col]),
+            elevation_m=float(grid.elevations[row, col]),
+            row=row,
+            col=col,
+        )
+        for row, col in ((5, 30), (35, 3), (0, 0))
+    ]
+    # A small group size splits the candidates across several stacked traces.
+    monkeypatch.setattr("highpoint.analysis.visibility.VISIBILITY_BATCH_RAYS", 16)
+
+    batch = compute_visibility_metrics_batch(grid, candidates, base_config)
+
+    assert len(batch) == len(candidates)
+    for candidate, metrics in zip(candidates, batch, strict=True):
+        single = compute_visibility_metrics(grid, candidate, base_config)
+        np.testing.assert_array_equal(metrics.ray_results, single.ray_results)
+        assert metrics.rays_with_clearance == single.rays_with_clearance
+        assert metrics.actual_fov_deg == single.actual_fov_deg
+        assert metrics.mean_distance_m == single.mean_distance_m
+    assert len({metrics.rays_with_clearance for metrics in batch}) > 1
+
+
+def test_bilinear__matches_scipy_linear_interpolation() -> None:
+    rng = np.random.default_rng(0)
+    elevations = rng.normal(100.0, 20.0, (7, 5)).astype(np.float32)
+    elevations[3, 2] = np.nan
+    rows = np.concatenate((rng.uniform(-1.0, 7.0, 200), [0.0, 6.0, 6.0, 3.0]))
+    cols = np.concatenate((rng.uniform(-1.0, 5.0, 200), [0.0, 4.0, 0.0, 2.0]))
+
+    expected = map_coordinates(elevations, [rows, cols], order=1, mode="nearest")
+
+    np.testing.assert_allclose(_bilinear(elevations, rows, cols), expected, rtol=1e-6)
+
+
 def test_field_of_view__requires_contiguous_clear_rays(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -136,11 +205,12 @@ def test_field_of_view__requires_contiguous_clear_rays(
         },
     )
 
-    def fake_trace_ray(**kwargs: Any) -> tuple[float, bool]:
-        angle = float(kwargs["angle_deg"])
-        return (2_000.0, True) if angle in {45.0, 315.0} else (100.0, True)
+    def fake_trace_rays(**kwargs: Any) -> tuple[np.ndarray, np.ndarray]:
+        angles = np.asarray(kwargs["angles_deg"])
+        distances = np.where(np.isin(angles, [45.0, 315.0]), 2_000.0, 100.0)
+        return distances[np.newaxis], np.ones((1, angles.size), dtype=bool)
 
-    monkeypatch.setattr("highpoint.analysis.visibility._trace_ray", fake_trace_ray)
+    monkeypatch.setattr("highpoint.analysis.visibility._trace_rays", fake_trace_rays)
 
     metrics = compute_visibility_metrics(grid, candidate, config)
 
@@ -159,7 +229,7 @@ def test_pipeline_rejects_candidate_below_fov_threshold(
         mean_distance_m=1_000.0,
         median_distance_m=1_000.0,
         actual_fov_deg=0.0,
-        ray_results={0.0: 2_000.0},
+        ray_results=np.array([2_000.0]),
         rays_with_clearance=1,
         total_rays=1,
     )
@@ -171,11 +241,16 @@ def test_pipeline_rejects_candidate_below_fov_threshold(
     monkeypatch.setattr("highpoint.pipeline._load_roads", lambda cfg, target_crs: road_network)
     monkeypatch.setattr("highpoint.pipeline.identify_candidates", lambda _: [candidate])
     monkeypatch.setattr("highpoint.pipeline.cluster_candidates", lambda items, _: list(items))
-    monkeypatch.setattr("highpoint.pipeline.compute_visibility_metrics", lambda *_: insufficient)
+    monkeypatch.setattr(
+        "highpoint.pipeline.compute_visibility_metrics_batch",
+        lambda _grid, candidates, _config: [insufficient] * len(candidates),
+    )
 
-    def fail_if_called(**_: Any) -> None:
-        raise AssertionError("drivability should not run for a rejected candidate")
+    def fail_if_called(**kwargs: Any) -> list[DrivabilityResult | None]:
+        if kwargs["candidates_xy"]:
+            raise AssertionError("drivability should not run for a rejected candidate")
+        return []
 
-    monkeypatch.setattr("highpoint.pipeline.evaluate_candidate_drivability", fail_if_called)
+    monkeypatch.setattr("highpoint.pipeline.evaluate_candidates_drivability", fail_if_called)
 
     assert run_pipeline(base_config).results == []
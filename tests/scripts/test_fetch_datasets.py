@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+import requests
 from scripts import fetch_datasets
 
 
@@ -14,12 +19,11 @@ def test_download_success__publishes_complete_file(
     destination.parent.mkdir(parents=True)
     destination.touch()
 
-    def retrieve(_url: str, filename: str | Path) -> tuple[str, None]:
-        path = Path(filename)
-        path.write_bytes(b"complete")
-        return str(path), None
+    def retrieve(_url: str, filename: Path) -> str:
+        filename.write_bytes(b"complete")
+        return hashlib.sha256(b"complete").hexdigest()
 
-    monkeypatch.setattr(fetch_datasets, "urlretrieve", retrieve)
+    monkeypatch.setattr(fetch_datasets, "_retrieve", retrieve)
 
     fetch_datasets.download("https://example.invalid/asset", destination, dry_run=False)
 
@@ -33,11 +37,11 @@ def test_download_failure__removes_partial_file(
 ) -> None:
     destination = tmp_path / "asset.bin"
 
-    def retrieve(_url: str, filename: str | Path) -> tuple[str, None]:
-        Path(filename).write_bytes(b"partial")
+    def retrieve(_url: str, filename: Path) -> str:
+        filename.write_bytes(b"partial")
         raise OSError("connection lost")
 
-    monkeypatch.setattr(fetch_datasets, "urlretrieve", retrieve)
+    monkeypatch.setattr(fetch_datasets, "_retrieve", retrieve)
 
     with pytest.raises(RuntimeError, match="Failed to download"):
         fetch_datasets.download("https://example.invalid/asset", destination, dry_run=False)
@@ -52,3 +56,199 @@ def test_download_dry_run__does_not_create_directories(tmp_path: Path) -> None:
     fetch_datasets.download("https://example.invalid/asset", destination, dry_run=True)
 
     assert not destination.parent.exists()
+
+
+def test_download_many__fetches_every_job(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    jobs = [(f"https://example.invalid/{index}", tmp_path / f"{index}.tif") for index in range(5)]
+
+    def retrieve(url: str, filename: Path) -> str:
+        filename.write_text(url, encoding="utf-8")
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    monkeypatch.setattr(fetch_datasets, "_retrieve", retrieve)
+
+    fetch_datasets.download_many(jobs, dry_run=False, concurrency=3)
+
+    for url, destination in jobs:
+        assert destination.read_text(encoding="utf-8") == url
+
+
+def test_download_many_high_concurrency__grows_connection_pool(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = fetch_datasets.http_session.__wrapped__()
+    jobs = [(f"https://example.invalid/{index}", tmp_path / f"{index}.tif") for index in range(40)]
+
+    def retrieve(url: str, filename: Path) -> str:
+        filename.write_text(url, encoding="utf-8")
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    monkeypatch.setattr(fetch_datasets, "_retrieve", retrieve)
+    monkeypatch.setattr(fetch_datasets, "http_session", lambda: session)
+
+    fetch_datasets.download_many(jobs, dry_run=False, concurrency=40)
+
+    adapter = session.get_adapter("https://")
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 40 * fetch_datasets.RANGE_CHUNKS
+    assert adapter.max_retries.total == 5
+
+
+def test_download_with_manifest__skips_only_matching_etag(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    destination = tmp_path / "tile.tif"
+    manifest = fetch_datasets.DownloadManifest(tmp_path / "manifest.json")
+    remote = fetch_datasets.RemoteMetadata(size=8, etag='"v1"')
+    calls: list[str] = []
+
+    def retrieve(url: str, filename: Path) -> str:
+        calls.append(url)
+        filename.write_bytes(b"complete")
+        return hashlib.sha256(b"complete").hexdigest()
+
+    monkeypatch.setattr(fetch_datasets, "_retrieve", retrieve)
+    monkeypatch.setattr(fetch_datasets, "remote_metadata", lambda _url: remote)
+
+    fetch_datasets.download("https://example.invalid/tile", destination, False, manifest)
+    manifest.save()
+    reloaded = fetch_datasets.DownloadManifest(tmp_path / "manifest.json")
+    fetch_datasets.download("https://example.invalid/tile", destination, False, reloaded)
+    assert len(calls) == 1
+
+    remote = fetch_datasets.RemoteMetadata(size=8, etag='"v2"')
+    fetch_datasets.download("https://example.invalid/tile", destination, False, reloaded)
+    assert len(calls) == 2
+
+
+def test_download_current_file__does_not_probe_range_support(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    destination = tmp_path / "tile.tif"
+    destination.write_bytes(b"complete")
+    manifest = fetch_datasets.DownloadManifest(tmp_path / "manifest.json")
+    remote = fetch_datasets.RemoteMetadata(size=8, etag='"v1"', accepts_ranges=None)
+    manifest.record(destination, remote)
+
+    def fail_probe(_url: str) -> bool:
+        raise AssertionError("up-to-date files must not pay for a range probe")
+
+    monkeypatch.setattr(fetch_datasets, "_probe_range_support", fail_probe)
+    monkeypatch.setattr(fetch_datasets, "remote_metadata", lambda _url: remote)
+
+    fetch_datasets.download("https://example.invalid/tile", destination, False, manifest)
+
+    assert destination.read_bytes() == b"complete"
+
+
+def test_download_checksum_mismatch__keeps_previous_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    destination = tmp_path / "tile.tif"
+    destination.write_bytes(b"previous")
+    manifest = fetch_datasets.DownloadManifest(tmp_path / "manifest.json")
+    remote = fetch_datasets.RemoteMetadata(
+        size=9,
+        etag='"v2"',
+        sha256=hashlib.sha256(b"published").hexdigest(),
+    )
+
+    def retrieve(_url: str, filename: Path) -> str:
+        filename.write_bytes(b"corrupted")
+        return hashlib.sha256(b"corrupted").hexdigest()
+
+    monkeypatch.setattr(fetch_datasets, "_retrieve", retrieve)
+    monkeypatch.setattr(fetch_datasets, "remote_metadata", lambda _url: remote)
+
+    with pytest.raises(RuntimeError, match="Failed to download"):
+        fetch_datasets.download("https://example.invalid/tile", destination, False, manifest)
+
+    assert destination.read_bytes() == b"previous"
+    assert not destination.with_name("tile.tif.part").exists()
+
+
+def test_decode_sha256__accepts_only_whole_object_checksums() -> None:
+    digest = hashlib.sha256(b"tile").digest()
+    encoded = base64.b64encode(digest).decode()
+
+    assert fetch_datasets._decode_sha256(encoded) == digest.hex()
+    assert fetch_datasets._decode_sha256(f"{encoded}-3") is None
+    assert fetch_datasets._decode_sha256(None) is None
+
+
+def test_corrupt_manifest__is_treated_as_empty(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{not json", encoding="utf-8")
+    destination = tmp_path / "tile.tif"
+    destination.write_bytes(b"truncated")
+
+    manifest = fetch_datasets.DownloadManifest(manifest_path)
+
+    assert not manifest.is_current(destination, fetch_datasets.RemoteMetadata(size=100, etag=None))
+
+
+class _RangeResponse:
+    status_code = 206
+
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.payload), chunk_size):
+            yield self.payload[start : start + chunk_size]
+
+    def __enter__(self) -> _RangeResponse:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        return None
+
+
+class _RangeSession:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.dropped: list[str] = []
+
+    def get(self, _url: str, *, headers: dict[str, str], **_kwargs: object) -> _RangeResponse:
+        start_text, end_text = headers["Range"].removeprefix("bytes=").split("-")
+        start, end = int(start_text), int(end_text)
+        if start == 0 and not self.dropped:
+            self.dropped.append(headers["Range"])
+            return _RangeResponse(self.payload[start : start + 100])
+        return _RangeResponse(self.payload[start : end + 1])
+
+
+def test_download_ranged__reassembles_and_resumes_dropped_range(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = bytes(range(256)) * 40
+    destination = tmp_path / "tile.tif"
+    session = _RangeSession(payload)
+    monkeypatch.setattr(fetch_datasets, "http_session", lambda: session)
+
+    fetch_datasets.download_ranged("https://example.invalid/tile", destination, len(payload), 3)
+
+    assert destination.read_bytes() == payload
+    assert session.dropped
+
+
+def test_download_ranged_without_pwrite__writes_each_range_in_place(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = bytes(range(256)) * 40
+    destination = tmp_path / "tile.tif"
+    monkeypatch.delattr(os, "pwrite", raising=False)
+    monkeypatch.setattr(fetch_datasets, "http_session", lambda: _RangeSession(payload))
+
+    fetch_datasets.download_ranged("https://example.invalid/tile", destination, len(payload), 4)
+
+    assert destination.read_bytes() == payload
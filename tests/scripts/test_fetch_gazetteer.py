@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import csv
+import io
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from scripts import fetch_gazetteer
+
+GNIS_HEADER = "feature_id|feature_name|feature_class|state_name|prim_lat_dec|prim_long_dec"
+GNIS_ROWS = [
+    "1512328|Issaquah|Populated Place|Washington|47.5301|-122.0326",
+    "1512329|Nowhere|Populated Place|Atlantis|1.0|2.0",
+    "1512330||Populated Place|Washington|47.0|-122.0",
+]
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes, status_code: int, headers: dict[str, str]) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        return None
+
+
+class _FakeSession:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.ranges: list[str] = []
+
+    def head(self, _url: str, **_kwargs: object) -> _FakeResponse:
+        headers = {"Content-Length": str(len(self.payload)), "Accept-Ranges": "bytes"}
+        return _FakeResponse(b"", 200, headers)
+
+    def get(self, _url: str, *, headers: dict[str, str], **_kwargs: object) -> _FakeResponse:
+        byte_range = headers["Range"]
+        self.ranges.append(byte_range)
+        start, end = (int(value) for value in byte_range.removeprefix("bytes=").split("-"))
+        return _FakeResponse(self.payload[start : end + 1], 206, {})
+
+    def __enter__(self) -> _FakeSession:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        return None
+
+
+class _NoHeadSession(_FakeSession):
+    def head(self, _url: str, **_kwargs: object) -> _FakeResponse:
+        return _FakeResponse(b"", 405, {})
+
+    def get(self, _url: str, **_kwargs: object) -> _FakeResponse:
+        return _FakeResponse(self.payload, 200, {})
+
+
+def _archive_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        text = "\n".join([GNIS_HEADER, *GNIS_ROWS]) + "\n"
+        archive.writestr("Text/PopulatedPlaces_National.txt", text)
+    return buffer.getvalue()
+
+
+def test_main__streams_archive_with_range_requests(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[_FakeSession] = []
+
+    def open_session() -> _FakeSession:
+        sessions.append(_FakeSession(_archive_bytes()))
+        return sessions[-1]
+
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path / "data"))
+    monkeypatch.setattr(fetch_gazetteer, "_http_session", open_session)
+    output = tmp_path / "gnis.csv"
+
+    fetch_gazetteer.main(output=output)
+
+    with output.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(sessions) == 1 and sessions[0].ranges
+    assert rows == [
+        {
+            "feature_id": "1512328",
+            "name": "Issaquah",
+            "state": "WA",
+            "latitude": "47.5301",
+            "longitude": "-122.0326",
+            "elevation_m": "",
+        },
+    ]
+
+
+def test_main_rejected_head__spools_archive(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _NoHeadSession(_archive_bytes())
+    monkeypatch.setenv("DATA_ROOT", str(tmp_path / "data"))
+    monkeypatch.setattr(fetch_gazetteer, "_http_session", lambda: session)
+    output = tmp_path / "gnis.csv"
+
+    fetch_gazetteer.main(output=output)
+
+    with output.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert not session.ranges
+    assert [row["name"] for row in rows] == ["Issaquah"]